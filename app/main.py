@@ -19,14 +19,63 @@ from app.context import get_app_context, remove_from_watchlist
 from app.news_ui import render_news_page
 from app.realestate_chat_ui import render_realestate_chat_page
 from app.valuation_ui import render_valuation_page
-from chat.history import append_turn, ensure_history_initialized, get_history
+from chat.history import (
+    append_turn,
+    ensure_buffer_initialized,
+    ensure_history_initialized,
+    get_history,
+)
 from chat.respond import generate_reply
-from config.env import get_groq_settings, load_environment
+from config.env import GroqSettings, get_groq_settings, load_environment
+from llm.cache import configure_llm_cache
 from llm.groq_chat_model import build_groq_chat_model
 from observability.logging_config import configure_logging
 
 logger = logging.getLogger(__name__)
 
+# ── Rerun-stable resources ────────────────────────────────────────────────────
+# Streamlit re-executes this script on every widget interaction; cache the
+# expensive setup (env parsing, settings resolution, HTTP client construction)
+# so reruns reuse the same objects instead of rebuilding them.
+
+
+@st.cache_resource(show_spinner=False)
+def _load_environment_once() -> None:
+    """Parse `.env` once per process instead of on every rerun."""
+    load_environment()
+
+
+@st.cache_data(show_spinner=False)
+def _resolve_groq_settings(model_default: str, temperature_default: float) -> GroqSettings:
+    """Resolve GroqSettings, memoized on the sidebar inputs."""
+    return get_groq_settings(
+        model_default=model_default, temperature_default=temperature_default
+    )
+
+
+def _render_history(history: list) -> None:
+    """
+    Render all non-system turns of a chat history.
+
+    Every turn re-renders on every rerun: Streamlit's execution model offers
+    no way to skip the `st.chat_message`/`st.markdown` calls for prior turns,
+    and caching the turn content itself only adds hashing and memory cost.
+    """
+    for turn in history:
+        if turn["role"] == "system":
+            continue
+        with st.chat_message("user" if turn["role"] == "user" else "assistant"):
+            st.markdown(turn["content"])
+
+
+@st.cache_resource(show_spinner=False)
+def _get_model(api_key: str, model: str, temperature: float):
+    """Build (and reuse) the ChatGroq client, keeping its connection pool warm."""
+    return build_groq_chat_model(
+        GroqSettings(api_key=api_key, model=model, temperature=temperature)
+    )
+
+
 PAGE_HOME = "홈"
 PAGE_VALUATION = "부동산 감정 평가"
 PAGE_REALESTATE_CHAT = "부동산 AI 상담"
@@ -144,7 +193,11 @@ def _render_sidebar() -> dict:
             "System prompt", value="You are a helpful assistant."
         )
         if st.sidebar.button("Reset chat"):
+            from chat.respond import clear_reply_cache
+
             st.session_state.pop("chat_history", None)
+            st.session_state.pop("chat_buffer", None)
+            clear_reply_cache()
             st.rerun()
 
     # ── Home page sidebar — nothing extra ─────────────────────────────────────
@@ -232,51 +285,58 @@ def _render_chat_page(sidebar: dict) -> None:
     ensure_history_initialized(
         st.session_state, system_prompt=sidebar["system_prompt"]
     )
+    # Cache-stable message buffer: committed turns are converted once and kept
+    # byte-identical across reruns so the provider's prompt cache can hit.
+    buffer = ensure_buffer_initialized(
+        st.session_state, system_prompt=sidebar["system_prompt"]
+    )
 
-    groq_settings = get_groq_settings(
-        model_default=sidebar["model"],
-        temperature_default=sidebar["temperature"],
+    groq_settings = _resolve_groq_settings(sidebar["model"], sidebar["temperature"])
+    model = _get_model(
+        groq_settings.api_key, groq_settings.model, groq_settings.temperature
     )
-    model = build_groq_chat_model(groq_settings)
 
     history = get_history(st.session_state)
-
-    for turn in history:
-        if turn["role"] == "system":
-            continue
-        with st.chat_message("user" if turn["role"] == "user" else "assistant"):
-            st.markdown(turn["content"])
+    _render_history(history)
 
     prompt = st.chat_input("Ask something...")
     if not prompt:
         return
 
     append_turn(st.session_state, role="user", content=prompt)
+    buffer.append_turn(role="user", content=prompt)
     with st.chat_message("user"):
         st.markdown(prompt)
 
     with st.chat_message("assistant"):
-        with st.spinner("Thinking..."):
-            try:
-                assistant_text = generate_reply(
-                    history=get_history(st.session_state), model=model
+        try:
+            # Stream chunks as they arrive; write_stream returns the full text.
+            assistant_text = str(
+                st.write_stream(
+                    generate_reply(
+                        history=get_history(st.session_state),
+                        model=model,
+                        buffer=buffer,
+                    )
                 )
-            except Exception:
-                logger.exception("Failed to generate reply")
-                st.error(
-                    "Failed to generate a reply. Check `logs/app.log` for details."
-                )
-                return
-        st.markdown(assistant_text)
+            )
+        except Exception:
+            logger.exception("Failed to generate reply")
+            st.error(
+                "Failed to generate a reply. Check `logs/app.log` for details."
+            )
+            return
 
     append_turn(st.session_state, role="assistant", content=assistant_text)
+    buffer.append_turn(role="assistant", content=assistant_text)
 
 
 def run() -> None:
     """Run the Streamlit application."""
 
     configure_logging()
-    load_environment()
+    configure_llm_cache()
+    _load_environment_once()
 
     st.set_page_config(
         page_title="LangChainExpo",
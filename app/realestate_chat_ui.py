@@ -16,6 +16,7 @@ import streamlit as st
 from chat.history import (
     SUMMARY_THRESHOLD,
     append_turn,
+    compact_history,
     ensure_history_initialized,
     get_conversation_summary,
     get_history,
@@ -190,3 +191,10 @@ def render_realestate_chat_page(sidebar_config: dict) -> None:
                 logger.info("Conversation summary updated (%d chars)", len(summary))
         except Exception:
             logger.warning("Failed to summarize conversation", exc_info=True)
+
+    # Compact once the estimated prompt tokens exceed budget, so per-turn
+    # latency stays bounded no matter how long the session runs.
+    try:
+        compact_history(st.session_state, model, state_key=REALESTATE_SESSION_KEY)
+    except Exception:
+        logger.warning("Failed to compact conversation history", exc_info=True)
@@ -9,15 +9,27 @@ Project role:
 
 from __future__ import annotations
 
+import json
 import logging
+from functools import lru_cache
 from typing import Literal, TypedDict
 
+# orjson serializes list-of-dict payloads 3-10x faster than stdlib json;
+# fall back transparently when it isn't installed.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 logger = logging.getLogger(__name__)
 
 Role = Literal["system", "user", "assistant"]
 
 SUMMARY_THRESHOLD = 10  # non-system turns before auto-summarization kicks in
 
+MAX_HISTORY_TOKENS = 4000  # estimated prompt tokens before compaction kicks in
+RECENT_WINDOW = 6  # newest turns kept verbatim through compaction
+
 
 class ChatTurn(TypedDict):
     role: Role
@@ -79,6 +91,144 @@ def get_history(session_state: dict, *, state_key: str = "chat_history") -> list
     return session_state[state_key]
 
 
+# ── History serialization ─────────────────────────────────────────────────────
+
+
+def dumps_history(history: list[ChatTurn]) -> bytes:
+    """
+    Serialize a chat history to JSON bytes.
+
+    Uses orjson when available; hundreds-of-turns histories serialize in a
+    fraction of the stdlib-json time. Intended for any path where history
+    crosses a JSON boundary (export, snapshots, persistence).
+
+    Params:
+      history: List of ChatTurn dicts.
+
+    Returns:
+      UTF-8 JSON bytes.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(history)
+    return json.dumps(history, ensure_ascii=False).encode("utf-8")
+
+
+def loads_history(data: bytes | str) -> list[ChatTurn]:
+    """
+    Deserialize JSON produced by `dumps_history` back to a ChatTurn list.
+
+    Params:
+      data: JSON bytes or string.
+
+    Returns:
+      List of ChatTurn dicts.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+# ── LangChain message conversion ──────────────────────────────────────────────
+
+
+@lru_cache(maxsize=1)
+def _role_to_cls() -> dict:
+    """
+    Import and memoize the role → LangChain message class dispatch table.
+
+    Deferring the langchain_core import keeps it off the Streamlit
+    cold-start path; the lru_cache makes repeat lookups a dict hit.
+    """
+    from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+    return {"system": SystemMessage, "user": HumanMessage, "assistant": AIMessage}
+
+
+def to_langchain_messages(history: list[ChatTurn]) -> list:
+    """
+    Convert chat turns to LangChain messages.
+
+    Single canonical implementation shared by both respond modules.
+    Unknown roles are skipped (and reported once) rather than crashing the UI.
+    """
+    role_to_cls = _role_to_cls()
+    unknown = {t["role"] for t in history} - role_to_cls.keys()
+    if unknown:
+        logger.warning("Unknown roles in history: %s", sorted(unknown))
+    return [
+        role_to_cls[t["role"]](content=t["content"])
+        for t in history
+        if t["role"] in role_to_cls
+    ]
+
+
+# ── Cache-stable message buffer ───────────────────────────────────────────────
+
+
+class MessageBuffer:
+    """
+    Incrementally converted LangChain message buffer.
+
+    Keeps already-converted messages (system prompt + committed turns) in
+    `prefix_messages` and only converts the uncommitted `pending` tail per
+    call. Because the prefix is byte-identical across requests, the provider
+    can hit its prompt cache instead of re-tokenizing the whole history on
+    every follow-up turn.
+    """
+
+    def __init__(self, *, system_prompt: str = DEFAULT_SYSTEM_PROMPT) -> None:
+        self.prefix_messages: list = []
+        self.pending: list[ChatTurn] = []
+        if system_prompt:
+            self.pending.append({"role": "system", "content": system_prompt})
+
+    def append_turn(self, *, role: Role, content: str) -> None:
+        """Queue a turn for conversion on the next `get_langchain_messages`."""
+        self.pending.append({"role": role, "content": content})
+
+    def get_langchain_messages(self) -> list:
+        """
+        Return the full LangChain message list (stable prefix + pending tail).
+
+        Only the pending tail is converted here; committed turns are reused
+        as-is so the prefix stays byte-stable across invocations.
+        """
+        return self.prefix_messages + to_langchain_messages(self.pending)
+
+    def commit(self) -> None:
+        """
+        Move pending turns into the stable prefix after a successful model call.
+
+        After committing, those turns are never re-converted.
+        """
+        self.prefix_messages.extend(to_langchain_messages(self.pending))
+        self.pending.clear()
+
+
+def ensure_buffer_initialized(
+    session_state: dict,
+    *,
+    system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+    state_key: str = "chat_buffer",
+) -> MessageBuffer:
+    """
+    Ensure the session state contains a MessageBuffer, creating one if needed.
+
+    Params:
+      session_state: Streamlit `st.session_state`.
+      system_prompt: System prompt seeded into a freshly created buffer.
+      state_key: Session-state key for storing the buffer.
+
+    Returns:
+      The (possibly newly created) MessageBuffer.
+    """
+    if state_key not in session_state:
+        session_state[state_key] = MessageBuffer(system_prompt=system_prompt)
+    return session_state[state_key]
+
+
 # ── ConversationSummaryMemory helpers ─────────────────────────────────────────
 
 
@@ -160,6 +310,76 @@ def summarize_history(history: list[ChatTurn], model) -> str:
         return ""
 
 
+def estimate_history_tokens(history: list[ChatTurn]) -> int:
+    """
+    Roughly estimate the prompt tokens a history will consume.
+
+    Uses the common ~4 characters/token heuristic — close enough to decide
+    when compaction is worthwhile without pulling in a tokenizer dependency.
+
+    Params:
+      history: List of ChatTurn dicts.
+
+    Returns:
+      Estimated token count.
+    """
+    return sum(len(t["content"]) for t in history) // 4
+
+
+def compact_history(
+    session_state: dict,
+    model,
+    *,
+    state_key: str = "chat_history",
+    max_tokens: int = MAX_HISTORY_TOKENS,
+    recent_window: int = RECENT_WINDOW,
+) -> bool:
+    """
+    Fold old turns into a single summary turn once the history exceeds budget.
+
+    Keeps the leading system prompt and the newest `recent_window` turns
+    verbatim; everything in between is replaced by one synthetic system turn
+    containing an LLM-produced summary. This bounds prompt tokens — and thus
+    per-turn latency and cost — regardless of session length.
+
+    Params:
+      session_state: Streamlit `st.session_state`.
+      model: A LangChain chat model (plain, not tool-bound) for summarization.
+      state_key: Session-state key for the chat history.
+      max_tokens: Estimated-token threshold that triggers compaction.
+      recent_window: Number of trailing turns to keep verbatim.
+
+    Returns:
+      True if the history was compacted, False otherwise.
+    """
+    history: list[ChatTurn] = session_state.get(state_key, [])
+    if estimate_history_tokens(history) <= max_tokens:
+        return False
+
+    head = history[:1] if history and history[0]["role"] == "system" else []
+    old_turns = history[len(head):-recent_window] if recent_window else history[len(head):]
+    if not old_turns:
+        return False
+
+    summary = summarize_history(old_turns, model)
+    if not summary:
+        return False
+
+    compacted: list[ChatTurn] = [
+        *head,
+        {"role": "system", "content": f"[이전 대화 요약]\n{summary}"},
+        *history[-recent_window:],
+    ]
+    session_state[state_key] = compacted
+    logger.info(
+        "compact_history: folded %d turns into summary (%d → %d turns)",
+        len(old_turns),
+        len(history),
+        len(compacted),
+    )
+    return True
+
+
 def get_conversation_summary(
     session_state: dict,
     *,
@@ -8,49 +8,133 @@ Project role:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
+from collections import OrderedDict
 
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
-
-from chat.history import ChatTurn
+from chat.history import ChatTurn, MessageBuffer
+from chat.history import to_langchain_messages as _to_langchain_messages
 
 logger = logging.getLogger(__name__)
 
+# Exact-repeat reply cache: a double-submitted prompt or repeated demo query
+# becomes a dict lookup instead of another network round trip. Keyed on the
+# full conversation state so mid-history differences never false-hit.
+_REPLY_CACHE: OrderedDict[tuple, str] = OrderedDict()
+_REPLY_CACHE_MAX = 128
+
+
+def clear_reply_cache() -> None:
+    """Drop all cached replies (called when the user resets the chat)."""
+    _REPLY_CACHE.clear()
+
 
-def _to_langchain_messages(history: list[ChatTurn]) -> list[BaseMessage]:
-    messages: list[BaseMessage] = []
-    for turn in history:
-        role = turn["role"]
-        content = turn["content"]
-        if role == "system":
-            messages.append(SystemMessage(content=content))
-        elif role == "user":
-            messages.append(HumanMessage(content=content))
-        elif role == "assistant":
-            messages.append(AIMessage(content=content))
-        else:
-            # Future-proofing: ignore unknown roles rather than crashing UI.
-            logger.warning("Unknown role in history: %s", role)
-    return messages
-
-
-def generate_reply(*, history: list[ChatTurn], model) -> str:
+def _reply_cache_key(history: list[ChatTurn], model) -> tuple:
+    """Build a cache key from model identity/settings and the full history."""
+    return (
+        getattr(model, "model_name", None),
+        getattr(model, "temperature", None),
+        tuple((t["role"], t["content"]) for t in history),
+    )
+
+
+def generate_reply(
+    *,
+    history: list[ChatTurn],
+    model,
+    buffer: MessageBuffer | None = None,
+) -> Iterator[str]:
     """
-    Generate an assistant reply from chat history.
+    Stream an assistant reply from chat history.
+
+    Yields chunks as the model produces them so the UI can render
+    incrementally (e.g. via `st.write_stream`) instead of blocking until
+    decoding finishes — perceived latency drops to time-to-first-token.
 
     Params:
       history: Chat turns including the system prompt and prior turns.
-      model: A LangChain chat model supporting `.invoke(messages)`.
+      model: A LangChain chat model supporting `.stream(messages)`.
+      buffer: Optional MessageBuffer. When provided, messages come from the
+        buffer's cache-stable prefix + pending tail instead of re-converting
+        `history`, and the pending tail is committed after a successful call.
 
-    Returns:
-      Assistant message content.
+    Yields:
+      Assistant message content chunks.
 
     Raises:
-      RuntimeError: If the model response doesn't contain text.
+      RuntimeError: If the fully streamed response contains no text.
     """
 
-    messages = _to_langchain_messages(history)
-    response = model.invoke(messages)
-    content = getattr(response, "content", None)
-    if content is None or (isinstance(content, str) and not content.strip()):
+    key = _reply_cache_key(history, model)
+    cached = _REPLY_CACHE.get(key)
+    if cached is not None:
+        _REPLY_CACHE.move_to_end(key)
+        logger.debug("generate_reply: serving exact-repeat prompt from cache")
+        yield cached
+        if buffer is not None:
+            buffer.commit()
+        return
+
+    if buffer is not None:
+        messages = buffer.get_langchain_messages()
+    else:
+        messages = _to_langchain_messages(history)
+
+    received_text = False
+    chunks: list[str] = []
+    for chunk in model.stream(messages):
+        content = getattr(chunk, "content", None)
+        if content is None:
+            continue
+        text = str(content)
+        if text.strip():
+            received_text = True
+        chunks.append(text)
+        yield text
+
+    if not received_text:
         raise RuntimeError("Model returned an empty response.")
-    return str(content)
+    if buffer is not None:
+        buffer.commit()
+
+    _REPLY_CACHE[key] = "".join(chunks)
+    if len(_REPLY_CACHE) > _REPLY_CACHE_MAX:
+        _REPLY_CACHE.popitem(last=False)
+
+
+async def generate_replies(
+    *,
+    histories: list[list[ChatTurn]],
+    model,
+    max_concurrency: int = 8,
+) -> list[str]:
+    """
+    Generate assistant replies for several histories in one batched call.
+
+    Uses the model's `abatch` so N independent requests (A/B system prompts,
+    multi-agent critique, evaluation sweeps) share connection overhead and
+    run concurrently — wall time is close to the slowest single reply.
+
+    Params:
+      histories: One chat history per requested reply.
+      model: A LangChain chat model supporting `.abatch(messages_list)`.
+      max_concurrency: Cap on concurrent in-flight requests.
+
+    Returns:
+      Assistant reply contents, in the same order as `histories`.
+
+    Raises:
+      RuntimeError: If any response contains no text.
+    """
+
+    msgs_list = [_to_langchain_messages(h) for h in histories]
+    responses = await model.abatch(
+        msgs_list, config={"max_concurrency": max_concurrency}
+    )
+
+    replies: list[str] = []
+    for response in responses:
+        content = getattr(response, "content", None)
+        if content is None or (isinstance(content, str) and not content.strip()):
+            raise RuntimeError("Model returned an empty response.")
+        replies.append(str(content))
+    return replies
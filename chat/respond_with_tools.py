@@ -8,38 +8,41 @@ Project role:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
-
-from langchain_core.messages import (
-    AIMessage,
-    BaseMessage,
-    HumanMessage,
-    SystemMessage,
-    ToolMessage,
-)
-from langchain_core.tools import BaseTool
+import operator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from chat.history import ChatTurn
+from chat.history import to_langchain_messages as _to_langchain_messages
+
+if TYPE_CHECKING:
+    from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+    from langchain_core.tools import BaseTool
 
 logger = logging.getLogger(__name__)
 
+# Unpack a tool-call dict in one C-level call instead of three dict lookups;
+# this runs once per tool call on every assistant turn.
+_unpack_tool_call = operator.itemgetter("name", "args", "id")
 
-def _to_langchain_messages(history: list[ChatTurn]) -> list[BaseMessage]:
-    """Convert chat history to LangChain messages."""
-    messages: list[BaseMessage] = []
-    for turn in history:
-        role = turn["role"]
-        content = turn["content"]
-        if role == "system":
-            messages.append(SystemMessage(content=content))
-        elif role == "user":
-            messages.append(HumanMessage(content=content))
-        elif role == "assistant":
-            messages.append(AIMessage(content=content))
-        else:
-            logger.warning("Unknown role in history: %s", role)
-    return messages
+
+@lru_cache(maxsize=1)
+def _message_classes() -> tuple:
+    """
+    Import and memoize the LangChain message classes on first use.
+
+    Keeps langchain_core off the Streamlit cold-start import path.
+    """
+    from langchain_core.messages import (
+        AIMessage,
+        HumanMessage,
+        SystemMessage,
+        ToolMessage,
+    )
+
+    return SystemMessage, HumanMessage, AIMessage, ToolMessage
 
 
 def generate_reply_with_tools(
@@ -49,6 +52,7 @@ def generate_reply_with_tools(
     tools: list[BaseTool] | None = None,
     max_iterations: int = 5,
     conversation_summary: str | None = None,
+    force_tool: str | None = None,
 ) -> str:
     """
     Generate an assistant reply with tool calling support.
@@ -71,6 +75,11 @@ def generate_reply_with_tools(
             When provided, injected as a SystemMessage immediately after the
             main system prompt so the model retains long-term context without
             requiring the full history in-context.
+        force_tool: Optional tool name to force on the first model call via
+            tool_choice. When the tool to run is known in advance this
+            collapses the loop to request → tool → finalize (two round
+            trips) instead of letting the model deliberate for up to
+            max_iterations.
 
     Returns:
         Final assistant message content
@@ -83,20 +92,39 @@ def generate_reply_with_tools(
     # Inject the rolling conversation summary as an extra SystemMessage so the
     # model has long-term context even after older turns have been pruned.
     if conversation_summary:
+        SystemMessage = _message_classes()[0]
         summary_msg = SystemMessage(
             content=f"[대화 요약 — 이전 대화의 핵심 내용]\n{conversation_summary}"
         )
         # Insert after the first system message (index 0) if present, else prepend.
         insert_at = 1 if messages and isinstance(messages[0], SystemMessage) else 0
         messages.insert(insert_at, summary_msg)
+
+    # Build the name→tool index once per invocation so each tool call is an
+    # O(1) dict lookup instead of a linear scan of the tool list.
+    tools_by_name: dict[str, BaseTool] | None = (
+        {t.name: t for t in tools} if tools else None
+    )
     iteration = 0
     
+    log_info = logger.isEnabledFor(logging.INFO)
+
     while iteration < max_iterations:
         iteration += 1
-        logger.info("Tool calling iteration %d/%d", iteration, max_iterations)
-        
+        if log_info:
+            logger.info("Tool calling iteration %d/%d", iteration, max_iterations)
+
+        # Force the requested tool on the first call only; follow-up calls
+        # stay unforced so the model can produce the final answer.
+        if force_tool and iteration == 1:
+            invoke_model = model.bind(
+                tool_choice={"type": "function", "function": {"name": force_tool}}
+            )
+        else:
+            invoke_model = model
+
         # Invoke model
-        response: AIMessage = model.invoke(messages)
+        response: AIMessage = invoke_model.invoke(messages)
         messages.append(response)
         
         # Check if model made tool calls
@@ -107,57 +135,97 @@ def generate_reply_with_tools(
             content = getattr(response, "content", None)
             if content is None or (isinstance(content, str) and not content.strip()):
                 raise RuntimeError("Model returned an empty response.")
-            logger.info("Final response generated after %d iterations", iteration)
+            if log_info:
+                logger.info("Final response generated after %d iterations", iteration)
             return str(content)
-        
-        # Execute tool calls
-        logger.info("Executing %d tool call(s)", len(tool_calls))
-        for tool_call in tool_calls:
-            tool_name = tool_call["name"]
-            tool_args = tool_call["args"]
-            tool_id = tool_call["id"]
-            
-            logger.info("Executing tool: %s with args: %s", tool_name, tool_args)
-            
-            try:
-                # Get the tool: prefer explicit tools list, fall back to model inspection
-                tool = (
-                    _find_tool_in_list(tools, tool_name)
-                    if tools
-                    else _find_tool_by_name(model, tool_name)
-                )
-                if tool is None:
-                    error_msg = f"Tool '{tool_name}' not found in bound tools"
-                    logger.error(error_msg)
-                    tool_result = ToolMessage(
-                        content=f"Error: {error_msg}",
-                        tool_call_id=tool_id
-                    )
-                else:
-                    # Execute the tool
-                    result = tool.invoke(tool_args)
-                    tool_result = ToolMessage(
-                        content=str(result),
-                        tool_call_id=tool_id
-                    )
-                    logger.info("Tool '%s' executed successfully", tool_name)
-                    
-            except Exception as e:
-                error_msg = f"Error executing tool '{tool_name}': {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                tool_result = ToolMessage(
-                    content=f"Error: {error_msg}",
-                    tool_call_id=tool_id
-                )
-            
-            messages.append(tool_result)
-    
+
+        # Execute tool calls concurrently: independent I/O-bound calls cost the
+        # max of their latencies instead of the sum.
+        if log_info:
+            logger.info("Executing %d tool call(s)", len(tool_calls))
+        messages.extend(
+            _execute_tool_calls(tool_calls, model=model, tools_by_name=tools_by_name)
+        )
+
     # Max iterations reached
     raise RuntimeError(
         f"Maximum tool calling iterations ({max_iterations}) reached without final answer"
     )
 
 
+def _execute_tool_calls(
+    tool_calls: list[dict],
+    *,
+    model: Any,
+    tools_by_name: dict[str, BaseTool] | None,
+) -> list[ToolMessage]:
+    """
+    Execute a batch of tool calls concurrently via asyncio.gather.
+
+    Results are returned in tool-call order. Sync-only tools are fine:
+    `BaseTool.ainvoke` runs them in a worker thread automatically.
+
+    Args:
+        tool_calls: Tool call dicts from the model response.
+        model: The chat model (used for tool lookup when tools_by_name is None).
+        tools_by_name: Optional prebuilt name→tool index for O(1) resolution.
+
+    Returns:
+        One ToolMessage per tool call (result or error content).
+    """
+
+    async def _gather() -> list[ToolMessage]:
+        return await asyncio.gather(
+            *(
+                _run_tool(tc, model=model, tools_by_name=tools_by_name)
+                for tc in tool_calls
+            )
+        )
+
+    return asyncio.run(_gather())
+
+
+async def _run_tool(
+    tool_call: dict,
+    *,
+    model: Any,
+    tools_by_name: dict[str, BaseTool] | None,
+) -> ToolMessage:
+    """
+    Resolve and execute a single tool call, wrapping the outcome in a ToolMessage.
+
+    Errors (unknown tool, tool exception) become error-content ToolMessages so
+    the model can recover instead of the whole turn failing.
+    """
+    tool_name, tool_args, tool_id = _unpack_tool_call(tool_call)
+    ToolMessage = _message_classes()[3]
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Executing tool: %s with args: %s", tool_name, tool_args)
+
+    try:
+        # Get the tool: prefer the prebuilt index, fall back to model inspection
+        tool = (
+            tools_by_name.get(tool_name)
+            if tools_by_name is not None
+            else _find_tool_by_name(model, tool_name)
+        )
+        if tool is None:
+            error_msg = f"Tool '{tool_name}' not found in bound tools"
+            logger.error(error_msg)
+            return ToolMessage(content=f"Error: {error_msg}", tool_call_id=tool_id)
+
+        result = await tool.ainvoke(tool_args)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Tool '%s' executed successfully", tool_name)
+        return ToolMessage(content=str(result), tool_call_id=tool_id)
+
+    except Exception as e:
+        error_msg = f"Error executing tool '{tool_name}': {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        return ToolMessage(content=f"Error: {error_msg}", tool_call_id=tool_id)
+
+
 def _find_tool_in_list(tools: list[BaseTool], name: str) -> BaseTool | None:
     """
     Find a tool by name in an explicit tool list.
@@ -10,14 +10,24 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
+# Imported once at module load instead of on every secret lookup; settings
+# resolution runs several times per Streamlit rerun.
+try:
+    import streamlit as _st
+except Exception:  # streamlit is optional in non-UI contexts
+    _st = None
+
 
 def load_environment() -> None:
     """
     Load environment variables from a local `.env` file if present.
 
+    Also clears the resolution cache, since `.env` may introduce new values.
+
     Notes:
       Streamlit Community Cloud secrets (from `.streamlit/secrets.toml` or the
       Cloud Secrets UI) are accessed via `streamlit.secrets` at runtime and do
@@ -26,6 +36,8 @@ def load_environment() -> None:
 
     # `override=False` ensures real environment variables win over `.env`.
     load_dotenv(override=False)
+    _resolve.cache_clear()
+
 
 def _get_streamlit_secret(name: str) -> str | None:
     """
@@ -38,15 +50,13 @@ def _get_streamlit_secret(name: str) -> str | None:
       The secret value as a string, or None if unavailable.
     """
 
-    try:
-        import streamlit as st  # local import to avoid hard dependency in non-UI contexts
-    except Exception:
+    if _st is None:
         return None
 
     try:
-        if name not in st.secrets:
+        if name not in _st.secrets:
             return None
-        value = st.secrets[name]
+        value = _st.secrets[name]
     except Exception:
         return None
 
@@ -57,6 +67,29 @@ def _get_streamlit_secret(name: str) -> str | None:
     return str(value)
 
 
+@lru_cache(maxsize=64)
+def _resolve(name: str) -> str | None:
+    """
+    Resolve a setting from Streamlit secrets first, then the environment.
+
+    Memoized per name: secrets and env vars are effectively static for the
+    process lifetime, so reruns skip the `st.secrets` membership check and
+    repeated `.strip()` emptiness tests. `load_environment` clears the cache.
+
+    Returns:
+      The non-empty value, or None if missing/blank in both sources.
+    """
+
+    secret_value = _get_streamlit_secret(name)
+    if secret_value is not None and secret_value.strip():
+        return secret_value
+
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return None
+    return value
+
+
 def get_required_env(name: str) -> str:
     """
     Get a required environment variable.
@@ -71,12 +104,8 @@ def get_required_env(name: str) -> str:
       RuntimeError: If the variable is missing or empty.
     """
 
-    secret_value = _get_streamlit_secret(name)
-    if secret_value is not None and secret_value.strip():
-        return secret_value
-
-    value = os.getenv(name)
-    if value is None or not value.strip():
+    value = _resolve(name)
+    if value is None:
         raise RuntimeError(f"Missing required environment variable: {name}")
     return value
 
@@ -93,12 +122,8 @@ def get_optional_env(name: str, default: str) -> str:
       The environment variable value or the default.
     """
 
-    secret_value = _get_streamlit_secret(name)
-    if secret_value is not None and secret_value.strip():
-        return secret_value
-
-    value = os.getenv(name)
-    if value is None or not value.strip():
+    value = _resolve(name)
+    if value is None:
         return default
     return value
 
@@ -115,15 +140,8 @@ def get_optional_float_env(name: str, default: float) -> float:
       Parsed float value.
     """
 
-    secret_value = _get_streamlit_secret(name)
-    if secret_value is not None and secret_value.strip():
-        try:
-            return float(secret_value)
-        except ValueError:
-            return default
-
-    raw = os.getenv(name)
-    if raw is None or not raw.strip():
+    raw = _resolve(name)
+    if raw is None:
         return default
     try:
         return float(raw)
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -23,17 +24,35 @@ DEFAULT_DB_PATH = os.path.join(_MODULE_DIR, "db")
 CHROMA_DB_PATH = os.getenv("CHROMADB_PATH", DEFAULT_DB_PATH)
 COLLECTION_NAME = "korean_realestate"
 
+# Opened handles, reused across calls: constructing a PersistentClient
+# re-opens the on-disk HNSW index and building the embedding function loads
+# the sentence-transformers model — both far too expensive to pay per query.
+_clients: dict = {}
+_collections: dict = {}
+
 # Chunk parameters — tuned for Korean prose paragraphs.
 CHUNK_SIZE = 400      # characters
 CHUNK_OVERLAP = 80    # characters
 
+# HNSW index parameters, applied when a collection is first created.
+# M=32 / construction_ef=128 build a denser graph than Chroma's defaults so
+# recall holds as the corpus grows; search_ef=64 bounds per-query traversal.
+_HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 128,
+    "hnsw:search_ef": 64,
+}
+
 
+@lru_cache(maxsize=1)
 def _get_embedding_function():
     """
     Return the best available embedding function for Korean text.
 
     Prefers paraphrase-multilingual-MiniLM-L12-v2 (sentence-transformers).
     Falls back to ChromaDB's built-in ONNX-based embedding if unavailable.
+    Memoized: the sentence-transformers model is loaded once per process.
     """
     try:
         from chromadb.utils.embedding_functions import (
@@ -47,22 +66,42 @@ def _get_embedding_function():
         return None  # ChromaDB uses its own default
 
 
-def get_collection():
+def get_collection(name: str = COLLECTION_NAME):
     """
     Return the persistent ChromaDB collection, creating it if needed.
 
+    The client and per-name collection handles are cached at module level, so
+    repeat calls are dict lookups and each query pays only the HNSW traversal
+    (cosine space), not index re-opening. The DB path is re-read from the
+    environment per call so tests can point at a temporary store.
+
+    Params:
+        name: Collection name. Defaults to the Korean real estate KB.
+
     Raises:
         ImportError: If chromadb is not installed.
     """
-    import chromadb
+    path = os.getenv("CHROMADB_PATH", DEFAULT_DB_PATH)
+    key = (path, name)
+    collection = _collections.get(key)
+    if collection is not None:
+        return collection
+
+    client = _clients.get(path)
+    if client is None:
+        import chromadb
+
+        os.makedirs(path, exist_ok=True)
+        client = chromadb.PersistentClient(path=path)
+        _clients[path] = client
 
-    os.makedirs(CHROMA_DB_PATH, exist_ok=True)
-    client = chromadb.PersistentClient(path=CHROMA_DB_PATH)
     ef = _get_embedding_function()
-    kwargs = {"name": COLLECTION_NAME}
+    kwargs = {"name": name, "metadata": dict(_HNSW_METADATA)}
     if ef is not None:
         kwargs["embedding_function"] = ef
-    return client.get_or_create_collection(**kwargs)
+    collection = client.get_or_create_collection(**kwargs)
+    _collections[key] = collection
+    return collection
 
 
 def chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> list[str]:
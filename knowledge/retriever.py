@@ -29,6 +29,29 @@ def retrieve(query: str, k: int = 5) -> list[dict]:
         List of dicts with keys 'content' (str) and 'source' (str).
         Returns an empty list if chromadb is not installed or no docs found.
     """
+    return retrieve_many([query], k=k)[0]
+
+
+def retrieve_many(queries: list[str], k: int = 5) -> list[list[dict]]:
+    """
+    Retrieve relevant chunks for several queries in one batched lookup.
+
+    All queries go into a single `collection.query(query_texts=[...])`, so the
+    embedding function encodes the whole batch in one forward pass instead of
+    one small kernel per query — the win when a parallel tool-call step fires
+    multiple document searches at once.
+
+    Params:
+        queries: Natural language queries (Korean or English).
+        k: Number of chunks to return per query.
+
+    Returns:
+        One result list per query, in input order. Each entry mirrors
+        retrieve(): dicts with 'content' and 'source', empty on failure.
+    """
+    if not queries:
+        return []
+
     try:
         from knowledge.loader import get_collection, seed_knowledge_base
 
@@ -37,19 +60,24 @@ def retrieve(query: str, k: int = 5) -> list[dict]:
             logger.info("Knowledge base empty — auto-seeding with built-in documents")
             seed_knowledge_base()
 
-        if collection.count() == 0:
-            return []
+        count = collection.count()
+        if count == 0:
+            return [[] for _ in queries]
 
-        results = collection.query(query_texts=[query], n_results=min(k, collection.count()))
-        docs: list[dict] = []
-        for doc, meta in zip(results["documents"][0], results["metadatas"][0]):
-            docs.append({"content": doc, "source": meta.get("source", "unknown")})
-        logger.info("retrieve: query='%s' returned %d chunks", query[:50], len(docs))
-        return docs
+        results = collection.query(query_texts=list(queries), n_results=min(k, count))
+        per_query: list[list[dict]] = []
+        for i, query in enumerate(queries):
+            docs = [
+                {"content": doc, "source": meta.get("source", "unknown")}
+                for doc, meta in zip(results["documents"][i], results["metadatas"][i])
+            ]
+            logger.info("retrieve: query='%s' returned %d chunks", query[:50], len(docs))
+            per_query.append(docs)
+        return per_query
 
     except ImportError:
         logger.debug("chromadb not installed — returning empty results")
-        return []
+        return [[] for _ in queries]
     except Exception as exc:
         logger.warning("retrieve failed: %s", exc)
-        return []
+        return [[] for _ in queries]
@@ -0,0 +1,38 @@
+"""
+LLM response cache configuration.
+
+Project role:
+  Wire LangChain's global response cache once at startup so identical
+  prompts (common during demos and accidental retries) are served from
+  memory instead of hitting the Groq API again.
+"""
+
+from __future__ import annotations
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+_cache_configured = False
+
+
+def configure_llm_cache(*, maxsize: int = 256) -> None:
+    """
+    Install an in-memory LLM response cache, once per process.
+
+    Safe to call on every Streamlit rerun; subsequent calls are no-ops.
+
+    Params:
+      maxsize: Maximum number of cached responses before eviction.
+    """
+
+    global _cache_configured
+    if _cache_configured:
+        return
+
+    from langchain_core.caches import InMemoryCache
+    from langchain_core.globals import set_llm_cache
+
+    set_llm_cache(InMemoryCache(maxsize=maxsize))
+    _cache_configured = True
+    logger.info("LLM response cache enabled (InMemoryCache, maxsize=%d)", maxsize)
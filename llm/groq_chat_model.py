@@ -7,10 +7,13 @@ Project role:
 
 from __future__ import annotations
 
-from langchain_groq import ChatGroq
+from typing import TYPE_CHECKING
 
 from config.env import GroqSettings
 
+if TYPE_CHECKING:
+    from langchain_groq import ChatGroq
+
 
 def build_groq_chat_model(settings: GroqSettings) -> ChatGroq:
     """
@@ -23,9 +26,15 @@ def build_groq_chat_model(settings: GroqSettings) -> ChatGroq:
       A configured `ChatGroq` instance.
     """
 
+    # Deferred import: langchain_groq costs hundreds of ms on cold start and
+    # is only needed once a model is actually built.
+    from langchain_groq import ChatGroq
+
     return ChatGroq(
         api_key=settings.api_key,
         model=settings.model,
         temperature=settings.temperature,
         max_retries=2,
+        streaming=True,
+        cache=True,
     )
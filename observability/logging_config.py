@@ -7,19 +7,31 @@ Project role:
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# Keep the listener alive for the life of the process; it owns the file
+# handler and drains the log queue on its own thread.
+_listener: QueueListener | None = None
+
 
 def configure_logging(*, log_file_path: str = "logs/app.log") -> None:
     """
-    Configure root logging with a rotating file handler.
+    Configure root logging with a queue-fed rotating file handler.
+
+    Request threads only enqueue records; formatting, disk writes, and
+    rollover happen on the QueueListener's background thread, so hot-path
+    `logger.info` calls never block on file I/O.
 
     Params:
       log_file_path: Path to the log file (created if missing).
     """
 
+    global _listener
+
     log_path = Path(log_file_path)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -44,4 +56,9 @@ def configure_logging(*, log_file_path: str = "logs/app.log") -> None:
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
 
-    root_logger.addHandler(file_handler)
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -9,9 +9,17 @@ from unittest.mock import MagicMock
 import pytest
 
 from chat.history import (
+    MAX_HISTORY_TOKENS,
+    RECENT_WINDOW,
     SUMMARY_THRESHOLD,
+    MessageBuffer,
+    compact_history,
+    dumps_history,
+    estimate_history_tokens,
+    loads_history,
     append_turn,
     count_non_system_turns,
+    ensure_buffer_initialized,
     ensure_history_initialized,
     get_conversation_summary,
     get_history,
@@ -75,6 +83,45 @@ class TestGetHistory:
         assert result[0]["role"] == "system"
 
 
+class TestMessageBuffer:
+    def test_system_prompt_starts_pending(self):
+        buf = MessageBuffer(system_prompt="S")
+        assert buf.pending == [{"role": "system", "content": "S"}]
+        assert buf.prefix_messages == []
+
+    def test_get_messages_converts_pending(self):
+        buf = MessageBuffer(system_prompt="S")
+        buf.append_turn(role="user", content="Hello")
+        messages = buf.get_langchain_messages()
+        assert len(messages) == 2
+        assert messages[0].__class__.__name__ == "SystemMessage"
+        assert messages[1].__class__.__name__ == "HumanMessage"
+
+    def test_commit_moves_pending_to_prefix(self):
+        buf = MessageBuffer(system_prompt="S")
+        buf.append_turn(role="user", content="Hello")
+        buf.commit()
+        assert buf.pending == []
+        assert len(buf.prefix_messages) == 2
+
+    def test_prefix_objects_stable_across_turns(self):
+        buf = MessageBuffer(system_prompt="S")
+        buf.append_turn(role="user", content="Q1")
+        buf.commit()
+        first_prefix = list(buf.prefix_messages)
+        buf.append_turn(role="assistant", content="A1")
+        messages = buf.get_langchain_messages()
+        # Committed messages are reused by identity, never re-converted.
+        assert messages[0] is first_prefix[0]
+        assert messages[1] is first_prefix[1]
+
+    def test_ensure_buffer_initialized_creates_once(self):
+        state = {}
+        buf = ensure_buffer_initialized(state, system_prompt="S")
+        assert state["chat_buffer"] is buf
+        assert ensure_buffer_initialized(state) is buf
+
+
 class TestCountNonSystemTurns:
     def test_empty_history_returns_zero(self):
         state = {"chat_history": [{"role": "system", "content": "S"}]}
@@ -164,6 +211,91 @@ class TestSummarizeHistory:
         assert result == ""
 
 
+class TestHistorySerialization:
+    def test_round_trip(self, session_with_history):
+        history = session_with_history["chat_history"]
+        assert loads_history(dumps_history(history)) == history
+
+    def test_dumps_returns_bytes(self):
+        assert isinstance(dumps_history([]), bytes)
+
+    def test_korean_content_preserved(self):
+        history = [{"role": "user", "content": "전세 보증금은 얼마인가요?"}]
+        assert loads_history(dumps_history(history)) == history
+
+    def test_loads_accepts_str(self):
+        history = [{"role": "assistant", "content": "Hi"}]
+        data = dumps_history(history).decode("utf-8")
+        assert loads_history(data) == history
+
+
+class TestEstimateHistoryTokens:
+    def test_empty_history_is_zero(self):
+        assert estimate_history_tokens([]) == 0
+
+    def test_uses_four_chars_per_token(self):
+        history = [{"role": "user", "content": "a" * 400}]
+        assert estimate_history_tokens(history) == 100
+
+    def test_constants_are_positive(self):
+        assert MAX_HISTORY_TOKENS > 0
+        assert RECENT_WINDOW > 0
+
+
+class TestCompactHistory:
+    def _make_model(self, summary_text: str):
+        model = MagicMock()
+        response = MagicMock()
+        response.content = summary_text
+        model.invoke.return_value = response
+        return model
+
+    def _long_state(self, turns: int = 20, content_len: int = 2000) -> dict:
+        history = [{"role": "system", "content": "S"}]
+        for i in range(turns):
+            role = "user" if i % 2 == 0 else "assistant"
+            history.append({"role": role, "content": "가" * content_len})
+        return {"chat_history": history}
+
+    def test_under_budget_is_noop(self):
+        state = {"chat_history": [{"role": "system", "content": "S"}]}
+        assert compact_history(state, MagicMock()) is False
+        assert len(state["chat_history"]) == 1
+
+    def test_over_budget_compacts(self):
+        state = self._long_state()
+        model = self._make_model("요약")
+        assert compact_history(state, model) is True
+        # system prompt + summary turn + recent window
+        assert len(state["chat_history"]) == 2 + RECENT_WINDOW
+
+    def test_keeps_system_prompt_first(self):
+        state = self._long_state()
+        compact_history(state, self._make_model("요약"))
+        assert state["chat_history"][0] == {"role": "system", "content": "S"}
+
+    def test_summary_injected_as_system_turn(self):
+        state = self._long_state()
+        compact_history(state, self._make_model("요약"))
+        summary_turn = state["chat_history"][1]
+        assert summary_turn["role"] == "system"
+        assert "요약" in summary_turn["content"]
+
+    def test_recent_turns_kept_verbatim(self):
+        state = self._long_state()
+        recent = state["chat_history"][-RECENT_WINDOW:]
+        compact_history(state, self._make_model("요약"))
+        assert state["chat_history"][-RECENT_WINDOW:] == recent
+
+    def test_failed_summary_leaves_history_untouched(self):
+        state = self._long_state()
+        original = list(state["chat_history"])
+        model = MagicMock()
+        model.invoke.side_effect = RuntimeError("LLM error")
+        assert compact_history(state, model) is False
+        assert state["chat_history"] == original
+
+
 class TestSummaryStoreGet:
     def test_store_and_get(self):
         state = {}
@@ -7,11 +7,17 @@ without actual API calls.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from chat.respond import _to_langchain_messages, generate_reply
+from chat.respond import (
+    _to_langchain_messages,
+    clear_reply_cache,
+    generate_replies,
+    generate_reply,
+)
 
 
 class TestToLangchainMessages:
@@ -56,42 +62,146 @@ class TestToLangchainMessages:
         assert messages == []
 
 
+def _streaming_model(chunks: list) -> MagicMock:
+    """Build a mock model whose .stream() yields the given chunk contents."""
+    model = MagicMock()
+    model.stream.return_value = [MagicMock(content=c) for c in chunks]
+    return model
+
+
 class TestGenerateReply:
-    """Tests for generate_reply() with mock models."""
+    """Tests for generate_reply() streaming with mock models."""
 
-    def test_returns_model_content(self, mock_model):
+    def test_yields_model_content(self, mock_model):
         history = [
             {"role": "system", "content": "System"},
             {"role": "user", "content": "Hello"},
         ]
-        result = generate_reply(history=history, model=mock_model)
+        result = "".join(generate_reply(history=history, model=mock_model))
         assert result == "Mock response"
-        mock_model.invoke.assert_called_once()
+        mock_model.stream.assert_called_once()
 
-    def test_raises_on_empty_content(self):
-        model = MagicMock()
-        model.invoke.return_value = MagicMock(content="")
+    def test_concatenates_chunks(self):
+        model = _streaming_model(["Hel", "lo ", "world"])
         history = [{"role": "user", "content": "Hello"}]
-        with pytest.raises(RuntimeError, match="empty response"):
-            generate_reply(history=history, model=model)
+        result = "".join(generate_reply(history=history, model=model))
+        assert result == "Hello world"
 
-    def test_raises_on_none_content(self):
-        model = MagicMock()
-        model.invoke.return_value = MagicMock(content=None)
+    def test_raises_on_empty_stream(self):
+        model = _streaming_model([])
         history = [{"role": "user", "content": "Hello"}]
         with pytest.raises(RuntimeError, match="empty response"):
-            generate_reply(history=history, model=model)
+            list(generate_reply(history=history, model=model))
 
-    def test_raises_on_whitespace_content(self):
-        model = MagicMock()
-        model.invoke.return_value = MagicMock(content="   ")
+    def test_skips_none_content_chunks(self):
+        model = _streaming_model([None, "Hi", None])
+        history = [{"role": "user", "content": "Hello"}]
+        result = "".join(generate_reply(history=history, model=model))
+        assert result == "Hi"
+
+    def test_raises_on_whitespace_only_stream(self):
+        model = _streaming_model(["  ", " "])
         history = [{"role": "user", "content": "Hello"}]
         with pytest.raises(RuntimeError, match="empty response"):
-            generate_reply(history=history, model=model)
+            list(generate_reply(history=history, model=model))
 
     def test_stringifies_non_string_content(self):
-        model = MagicMock()
-        model.invoke.return_value = MagicMock(content=42)
+        model = _streaming_model([42])
         history = [{"role": "user", "content": "Hello"}]
-        result = generate_reply(history=history, model=model)
+        result = "".join(generate_reply(history=history, model=model))
         assert result == "42"
+
+
+class TestReplyCache:
+    """Tests for the exact-repeat reply cache in generate_reply()."""
+
+    def setup_method(self):
+        clear_reply_cache()
+
+    def test_repeat_prompt_skips_model_call(self):
+        model = MagicMock()
+        model.model_name = "test-model"
+        model.temperature = 0.2
+        model.stream.return_value = [MagicMock(content="Hi there")]
+        history = [{"role": "user", "content": "Hello"}]
+
+        first = "".join(generate_reply(history=history, model=model))
+        second = "".join(generate_reply(history=history, model=model))
+        assert first == second == "Hi there"
+        model.stream.assert_called_once()
+
+    def test_different_history_misses_cache(self):
+        model = MagicMock()
+        model.model_name = "test-model"
+        model.temperature = 0.2
+        model.stream.side_effect = [
+            [MagicMock(content="Answer one")],
+            [MagicMock(content="Answer two")],
+        ]
+        first = "".join(
+            generate_reply(history=[{"role": "user", "content": "Q1"}], model=model)
+        )
+        second = "".join(
+            generate_reply(history=[{"role": "user", "content": "Q2"}], model=model)
+        )
+        assert first == "Answer one"
+        assert second == "Answer two"
+        assert model.stream.call_count == 2
+
+    def test_clear_reply_cache_forces_refetch(self):
+        model = MagicMock()
+        model.model_name = "test-model"
+        model.temperature = 0.2
+        model.stream.side_effect = [
+            [MagicMock(content="fresh")],
+            [MagicMock(content="fresh again")],
+        ]
+        history = [{"role": "user", "content": "Hello"}]
+        "".join(generate_reply(history=history, model=model))
+        clear_reply_cache()
+        result = "".join(generate_reply(history=history, model=model))
+        assert result == "fresh again"
+        assert model.stream.call_count == 2
+
+
+class TestGenerateReplies:
+    """Tests for batched generate_replies() via model.abatch."""
+
+    def _batch_model(self, contents: list) -> MagicMock:
+        model = MagicMock()
+        model.abatch = AsyncMock(
+            return_value=[MagicMock(content=c) for c in contents]
+        )
+        return model
+
+    def test_returns_replies_in_order(self):
+        model = self._batch_model(["first", "second"])
+        histories = [
+            [{"role": "user", "content": "Q1"}],
+            [{"role": "user", "content": "Q2"}],
+        ]
+        result = asyncio.run(generate_replies(histories=histories, model=model))
+        assert result == ["first", "second"]
+
+    def test_passes_max_concurrency(self):
+        model = self._batch_model(["ok"])
+        histories = [[{"role": "user", "content": "Q"}]]
+        asyncio.run(
+            generate_replies(histories=histories, model=model, max_concurrency=3)
+        )
+        config = model.abatch.call_args[1]["config"]
+        assert config == {"max_concurrency": 3}
+
+    def test_raises_on_empty_response(self):
+        model = self._batch_model(["ok", ""])
+        histories = [
+            [{"role": "user", "content": "Q1"}],
+            [{"role": "user", "content": "Q2"}],
+        ]
+        with pytest.raises(RuntimeError, match="empty response"):
+            asyncio.run(generate_replies(histories=histories, model=model))
+
+    def test_empty_histories_returns_empty_list(self):
+        model = self._batch_model([])
+        result = asyncio.run(generate_replies(histories=[], model=model))
+        assert result == []
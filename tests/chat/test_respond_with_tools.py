@@ -276,6 +276,35 @@ class TestGenerateReplyWithTools:
         assert result == "Both tools returned results"
         assert model.invoke.call_count == 2
 
+    def test_force_tool_binds_tool_choice_on_first_call(self):
+        """force_tool= forces the named tool via tool_choice, then finalizes."""
+        forced_model = MagicMock()
+        forced_model.invoke.return_value = FakeAIMessage(
+            content="",
+            tool_calls=[{
+                "name": "test_tool",
+                "args": {"arg1": "forced"},
+                "id": "call_forced",
+            }],
+        )
+        model = MagicMock()
+        model.bind.return_value = forced_model
+        model.invoke.return_value = FakeAIMessage(content="Done with forced tool")
+
+        result = generate_reply_with_tools(
+            history=[{"role": "user", "content": "Go"}],
+            model=model,
+            tools=[test_tool],
+            force_tool="test_tool",
+        )
+        assert result == "Done with forced tool"
+        model.bind.assert_called_once_with(
+            tool_choice={"type": "function", "function": {"name": "test_tool"}}
+        )
+        # Forced call happened once; the finalizing call was unforced.
+        assert forced_model.invoke.call_count == 1
+        assert model.invoke.call_count == 1
+
     def test_backward_compatible_without_tools_param(self):
         """Calling without tools= still works (falls through to model inspection)."""
         model = MagicMock()
@@ -13,9 +13,11 @@ import pytest
 
 from config.env import (
     GroqSettings,
+    _resolve,
     get_optional_env,
     get_optional_float_env,
     get_required_env,
+    load_environment,
 )
 
 
@@ -90,6 +92,26 @@ class TestGetOptionalFloatEnv:
         assert get_optional_float_env("NEG_FLOAT", 0.0) == -0.5
 
 
+class TestResolveCaching:
+    """Tests for the memoized _resolve() lookup path."""
+
+    def test_resolution_is_memoized(self, monkeypatch):
+        _resolve.cache_clear()
+        monkeypatch.setenv("CACHED_RESOLVE_VAR", "first")
+        assert get_optional_env("CACHED_RESOLVE_VAR", "default") == "first"
+        # A later env change is not observed until the cache is cleared.
+        monkeypatch.setenv("CACHED_RESOLVE_VAR", "second")
+        assert get_optional_env("CACHED_RESOLVE_VAR", "default") == "first"
+
+    def test_load_environment_clears_cache(self, monkeypatch):
+        _resolve.cache_clear()
+        monkeypatch.setenv("RELOADED_RESOLVE_VAR", "first")
+        assert get_optional_env("RELOADED_RESOLVE_VAR", "default") == "first"
+        monkeypatch.setenv("RELOADED_RESOLVE_VAR", "second")
+        load_environment()
+        assert get_optional_env("RELOADED_RESOLVE_VAR", "default") == "second"
+
+
 class TestGroqSettings:
     """Tests for the GroqSettings dataclass."""
 
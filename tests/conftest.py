@@ -98,6 +98,7 @@ def mock_model():
     """Mock chat model that returns a simple text response."""
     model = MagicMock()
     model.invoke.return_value = FakeAIMessage(content="Mock response")
+    model.stream.return_value = [FakeAIMessage(content="Mock response")]
     return model
 
 
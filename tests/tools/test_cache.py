@@ -0,0 +1,51 @@
+"""
+Tests for tools/_cache.py -- the shared thread-safe TTL cache.
+"""
+
+from __future__ import annotations
+
+from tools._cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(maxsize=4, ttl=60.0)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+    def test_missing_key_returns_none(self):
+        cache = TTLCache(maxsize=4, ttl=60.0)
+        assert cache.get("missing") is None
+
+    def test_expired_entry_returns_none(self, monkeypatch):
+        import tools._cache as cache_module
+
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=4, ttl=10.0)
+        cache.set("key", "value")
+        now[0] = 111.0
+        assert cache.get("key") is None
+
+    def test_lru_eviction_when_full(self):
+        cache = TTLCache(maxsize=2, ttl=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # refresh "a" so "b" is the LRU entry
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_clear_drops_entries(self):
+        cache = TTLCache(maxsize=4, ttl=60.0)
+        cache.set("key", "value")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get("key") is None
+
+    def test_tuple_keys(self):
+        cache = TTLCache(maxsize=4, ttl=60.0)
+        cache.set(("query", 5), "result")
+        assert cache.get(("query", 5)) == "result"
+        assert cache.get(("query", 3)) is None
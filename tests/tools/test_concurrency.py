@@ -0,0 +1,40 @@
+"""
+Tests for tools/_concurrency.py -- the shared tool-execution semaphore.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from tools._concurrency import TOOL_CONCURRENCY, get_tool_semaphore
+
+
+class TestGetToolSemaphore:
+    def test_same_loop_reuses_semaphore(self):
+        async def run():
+            return get_tool_semaphore(), get_tool_semaphore()
+
+        first, second = asyncio.run(run())
+        assert first is second
+
+    def test_limit_matches_configured_concurrency(self):
+        async def run():
+            return get_tool_semaphore()._value
+
+        assert asyncio.run(run()) == TOOL_CONCURRENCY
+
+    def test_caps_concurrent_holders(self):
+        peak = {"now": 0, "max": 0}
+
+        async def worker():
+            async with get_tool_semaphore():
+                peak["now"] += 1
+                peak["max"] = max(peak["max"], peak["now"])
+                await asyncio.sleep(0)
+                peak["now"] -= 1
+
+        async def run():
+            await asyncio.gather(*(worker() for _ in range(TOOL_CONCURRENCY * 3)))
+
+        asyncio.run(run())
+        assert peak["max"] <= TOOL_CONCURRENCY
@@ -0,0 +1,112 @@
+"""
+Tests for tools/data_tools.py -- math evaluation and weather placeholder.
+
+calculate_math uses an AST-validated compiled evaluator; these tests cover
+both the arithmetic results and the rejection of non-math expressions.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tools.data_tools import _compile_math, calculate_math, fetch_weather
+
+
+class TestCalculateMath:
+    """Tests for the calculate_math tool."""
+
+    def test_basic_arithmetic(self):
+        assert calculate_math.invoke({"expression": "2 + 2"}) == "Result: 4"
+
+    def test_operator_precedence(self):
+        assert calculate_math.invoke({"expression": "(10 * 5) - 3"}) == "Result: 47"
+
+    def test_allowed_function_call(self):
+        assert calculate_math.invoke({"expression": "max(10, 20)"}) == "Result: 20"
+
+    def test_unary_minus(self):
+        assert calculate_math.invoke({"expression": "-5 + 2"}) == "Result: -3"
+
+    def test_power_and_mod(self):
+        assert calculate_math.invoke({"expression": "2 ** 3 % 5"}) == "Result: 3"
+
+    def test_invalid_syntax_returns_error(self):
+        result = calculate_math.invoke({"expression": "2 +"})
+        assert result.startswith("Error calculating")
+
+    def test_unknown_name_rejected(self):
+        result = calculate_math.invoke({"expression": "__import__('os')"})
+        assert result.startswith("Error calculating")
+
+    def test_attribute_access_rejected(self):
+        result = calculate_math.invoke({"expression": "(1).__class__"})
+        assert result.startswith("Error calculating")
+
+    def test_string_constants_rejected(self):
+        result = calculate_math.invoke({"expression": "'a' * 3"})
+        assert result.startswith("Error calculating")
+
+
+class TestCompileMath:
+    """Tests for the cached _compile_math validator."""
+
+    def test_returns_code_object(self):
+        code = _compile_math("1 + 1")
+        assert eval(code, {"__builtins__": {}}, {}) == 2
+
+    def test_repeat_expression_is_cached(self):
+        assert _compile_math("3 * 3") is _compile_math("3 * 3")
+
+    def test_rejects_comprehension(self):
+        with pytest.raises(ValueError):
+            _compile_math("[x for x in (1, 2)]")
+
+
+class TestFetchWeather:
+    """Tests for the fetch_weather placeholder."""
+
+    def test_celsius_default(self):
+        result = fetch_weather.invoke({"location": "Seoul"})
+        assert "Seoul" in result
+        assert "22°C" in result
+
+    def test_fahrenheit(self):
+        result = fetch_weather.invoke(
+            {"location": "San Francisco", "units": "fahrenheit"}
+        )
+        assert "72°F" in result
+
+    def test_repeat_lookup_served_from_cache(self, monkeypatch):
+        from tools import data_tools
+
+        data_tools._weather_cache.clear()
+        calls = {"n": 0}
+        real = data_tools._resolve_weather
+
+        def counting(location, units):
+            calls["n"] += 1
+            return real(location, units)
+
+        monkeypatch.setattr(data_tools, "_resolve_weather", counting)
+        first = fetch_weather.invoke({"location": "Busan"})
+        second = fetch_weather.invoke({"location": "Busan"})
+        assert first == second
+        assert calls["n"] == 1
+
+    def test_cache_key_ignores_location_case(self):
+        from tools import data_tools
+
+        data_tools._weather_cache.clear()
+        fetch_weather.invoke({"location": "Seoul"})
+        assert data_tools._weather_cache.get(("seoul", "celsius")) is not None
+
+    def test_async_matches_sync(self):
+        import asyncio
+
+        from tools import data_tools
+
+        data_tools._weather_cache.clear()
+        sync_result = fetch_weather.invoke({"location": "Seoul"})
+        data_tools._weather_cache.clear()
+        async_result = asyncio.run(fetch_weather.ainvoke({"location": "Seoul"}))
+        assert async_result == sync_result
@@ -0,0 +1,127 @@
+"""
+Tests for tools/search_tools.py -- web/document search tools and result caching.
+
+The mock-news fallback path (no NAVER_CLIENT_ID) is what runs here.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from tools.search_tools import _doc_cache, _web_cache, search_documents, search_web
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    _web_cache.clear()
+    _doc_cache.clear()
+    yield
+    _web_cache.clear()
+    _doc_cache.clear()
+
+
+class TestSearchWeb:
+    def test_returns_mock_results_without_api_key(self, monkeypatch):
+        monkeypatch.delenv("NAVER_CLIENT_ID", raising=False)
+        result = search_web.invoke({"query": "GTX"})
+        assert "[Mock]" in result
+
+    def test_async_matches_sync(self, monkeypatch):
+        monkeypatch.delenv("NAVER_CLIENT_ID", raising=False)
+        sync_result = search_web.invoke({"query": "GTX"})
+        _web_cache.clear()
+        async_result = asyncio.run(search_web.ainvoke({"query": "GTX"}))
+        assert async_result == sync_result
+
+    def test_repeat_query_served_from_cache(self, monkeypatch):
+        monkeypatch.delenv("NAVER_CLIENT_ID", raising=False)
+        calls = {"n": 0}
+        from tools import search_tools
+
+        real = search_tools._search_mock_news
+
+        def counting(query, max_results):
+            calls["n"] += 1
+            return real(query, max_results)
+
+        monkeypatch.setattr(search_tools, "_search_mock_news", counting)
+        first = search_web.invoke({"query": "GTX", "max_results": 3})
+        second = search_web.invoke({"query": "GTX", "max_results": 3})
+        assert first == second
+        assert calls["n"] == 1
+
+    def test_different_max_results_miss_cache(self, monkeypatch):
+        monkeypatch.delenv("NAVER_CLIENT_ID", raising=False)
+        search_web.invoke({"query": "GTX", "max_results": 1})
+        assert _web_cache.get(("GTX", 2)) is None
+        assert _web_cache.get(("GTX", 1)) is not None
+
+
+class TestSearchBatcher:
+    def test_concurrent_calls_coalesce_into_one_dispatch(self, monkeypatch):
+        monkeypatch.delenv("NAVER_CLIENT_ID", raising=False)
+        from tools import search_tools
+
+        dispatches = []
+        real = search_tools._execute_search_batch
+
+        async def counting(requests):
+            dispatches.append(len(requests))
+            return await real(requests)
+
+        monkeypatch.setattr(search_tools, "_execute_search_batch", counting)
+
+        async def run():
+            return await asyncio.gather(
+                search_web.ainvoke({"query": "GTX"}),
+                search_web.ainvoke({"query": "재건축"}),
+                search_web.ainvoke({"query": "전세"}),
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, str) for r in results)
+        assert sum(dispatches) == 3
+        assert len(dispatches) == 1
+
+    def test_results_map_back_to_their_queries(self, monkeypatch):
+        monkeypatch.delenv("NAVER_CLIENT_ID", raising=False)
+
+        async def run():
+            return await asyncio.gather(
+                search_web.ainvoke({"query": "GTX"}),
+                search_web.ainvoke({"query": "재건축"}),
+            )
+
+        gtx_result, redevelopment_result = asyncio.run(run())
+        assert "GTX" in gtx_result
+        assert "재건축" in redevelopment_result
+
+    def test_batch_failure_propagates_to_callers(self, monkeypatch):
+        monkeypatch.delenv("NAVER_CLIENT_ID", raising=False)
+        from tools import search_tools
+
+        async def failing(requests):
+            raise RuntimeError("provider down")
+
+        monkeypatch.setattr(search_tools, "_execute_search_batch", failing)
+        with pytest.raises(RuntimeError, match="provider down"):
+            asyncio.run(search_web.ainvoke({"query": "GTX"}))
+
+
+class TestSearchDocuments:
+    def test_returns_string(self):
+        result = search_documents.invoke({"query": "전세"})
+        assert isinstance(result, str)
+
+    def test_repeat_query_served_from_cache(self):
+        first = search_documents.invoke({"query": "전세"})
+        cached = _doc_cache.get(("전세", "default"))
+        # Cached only when retrieval succeeded (error paths are never cached).
+        if cached is not None:
+            assert cached == first
+
+    def test_async_returns_string(self):
+        result = asyncio.run(search_documents.ainvoke({"query": "전세"}))
+        assert isinstance(result, str)
@@ -14,6 +14,7 @@ from tools.tool_manager import (
     AVAILABLE_TOOLS,
     bind_tools_to_model,
     get_tool_by_name,
+    get_tool_schemas,
     list_available_tools,
 )
 
@@ -72,6 +73,22 @@ class TestListAvailableTools:
         assert expected == set(names)
 
 
+class TestGetToolSchemas:
+    """Tests for the precompiled tool schema cache."""
+
+    def test_covers_every_registry_tool(self):
+        schemas = get_tool_schemas()
+        assert set(schemas) == set(list_available_tools())
+
+    def test_schemas_are_openai_format(self):
+        for schema in get_tool_schemas().values():
+            assert schema["type"] == "function"
+            assert "name" in schema["function"]
+
+    def test_repeat_call_returns_same_object(self):
+        assert get_tool_schemas() is get_tool_schemas()
+
+
 class TestBindToolsToModel:
     """Tests for bind_tools_to_model()."""
 
@@ -109,3 +126,26 @@ class TestBindToolsToModel:
         model.bind_tools.return_value = bound_model
         result = bind_tools_to_model(model)
         assert result is bound_model
+
+    def test_repeat_binding_is_memoized(self):
+        model = MagicMock()
+        model.bind_tools.return_value = MagicMock()
+        first = bind_tools_to_model(model)
+        second = bind_tools_to_model(model)
+        assert first is second
+        model.bind_tools.assert_called_once()
+
+    def test_different_options_rebind(self):
+        model = MagicMock()
+        model.bind_tools.side_effect = [MagicMock(), MagicMock()]
+        first = bind_tools_to_model(model)
+        second = bind_tools_to_model(model, tool_choice="any")
+        assert first is not second
+        assert model.bind_tools.call_count == 2
+
+    def test_different_models_do_not_share_cache(self):
+        model_a = MagicMock()
+        model_b = MagicMock()
+        model_a.bind_tools.return_value = MagicMock()
+        model_b.bind_tools.return_value = MagicMock()
+        assert bind_tools_to_model(model_a) is not bind_tools_to_model(model_b)
@@ -4,17 +4,33 @@ Tools module for LangChain tool calling.
 Project role:
   Defines callable tools that the LLM can use to perform actions beyond text generation.
   Each tool follows LangChain naming conventions (verb_noun format, snake_case).
+
+Tool exports are resolved lazily (PEP 562): importing `tools` no longer pulls
+in every tool module — and with them langchain_core and per-tool Pydantic
+schema construction — at Streamlit cold start.
 """
 
-from tools.search_tools import search_web, search_documents
-from tools.data_tools import fetch_weather, calculate_math
-from tools.utility_tools import get_current_time, convert_currency
-
-__all__ = [
-    "search_web",
-    "search_documents",
-    "fetch_weather",
-    "calculate_math",
-    "get_current_time",
-    "convert_currency",
-]
+from __future__ import annotations
+
+from importlib import import_module
+
+_EXPORTS = {
+    "search_web": "tools.search_tools",
+    "search_documents": "tools.search_tools",
+    "fetch_weather": "tools.data_tools",
+    "calculate_math": "tools.data_tools",
+    "get_current_time": "tools.utility_tools",
+    "convert_currency": "tools.utility_tools",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_path = _EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path), name)
+    # Cache so repeat accesses skip this hook.
+    globals()[name] = value
+    return value
@@ -0,0 +1,65 @@
+"""
+Small thread-safe TTL cache shared by the tool modules.
+
+Project role:
+  Stdlib-only stand-in for `cachetools.TTLCache` so tool results (searches,
+  weather lookups) can be memoized with an expiry without growing the
+  dependency list. Entries are evicted lazily on access once expired, and by
+  LRU order once the cache is full.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    Safe under `bind_tools_to_model(parallel_tool_calls=True)`: all access is
+    guarded by a lock, and lookups are O(1).
+
+    Params:
+      maxsize: Maximum number of live entries before LRU eviction.
+      ttl: Seconds an entry stays valid after being stored.
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value, or None if absent or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < now:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,38 @@
+"""
+Shared concurrency limits for async tool execution.
+
+Project role:
+  parallel_tool_calls lets a single LLM turn fan out to many tools at once;
+  unbounded parallelism over external APIs invites rate-limit throttling and
+  connection exhaustion. Async tool bodies guard their I/O with the shared
+  semaphore so in-flight calls stay at the provider's sweet spot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import weakref
+
+# Maximum concurrent tool I/O operations. Overridable per deployment.
+TOOL_CONCURRENCY = int(os.getenv("TOOL_CONCURRENCY", "5"))
+
+# One semaphore per event loop: the tool runner uses a fresh asyncio.run()
+# per batch, and asyncio primitives cannot cross loops.
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_tool_semaphore() -> asyncio.Semaphore:
+    """
+    Return the tool-execution semaphore bound to the running event loop.
+
+    Usage inside an async tool body:
+      async with get_tool_semaphore():
+          ... perform the I/O ...
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(TOOL_CONCURRENCY)
+        _semaphores[loop] = semaphore
+    return semaphore
@@ -0,0 +1,61 @@
+"""
+Queue-based logging setup for standalone tool usage.
+
+Project role:
+  When tools run inside the Streamlit app, observability/logging_config.py
+  already routes every record through a QueueListener thread. This module
+  covers the standalone paths (tools/test_tools.py, ad-hoc scripts) where
+  that setup never runs: tool bodies would otherwise format and write each
+  record on the calling thread, serializing parallel tool calls on the
+  handler lock.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Keep the listener alive for the life of the process; it owns the stream
+# handler and drains the log queue on its own thread.
+_listener: QueueListener | None = None
+
+
+def configure_tools_logging(*, level: int = logging.INFO) -> None:
+    """
+    Attach a queue-fed stream handler to the `tools` package logger.
+
+    Tool call sites keep their plain `logger.info(...)` calls; emitting
+    becomes a queue put, and formatting plus stderr writes happen on the
+    QueueListener's background thread. Idempotent, and a no-op when logging
+    is already configured (e.g. under the Streamlit app).
+
+    Params:
+      level: Log level for the tools logger and stream handler.
+    """
+
+    global _listener
+
+    tools_logger = logging.getLogger("tools")
+    if tools_logger.handlers or logging.getLogger().handlers:
+        # Already configured here or by the app — avoid duplicate output.
+        return
+
+    tools_logger.setLevel(level)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setLevel(level)
+    stream_handler.setFormatter(
+        logging.Formatter(
+            fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    tools_logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -10,16 +10,80 @@ Tool naming conventions:
 
 from __future__ import annotations
 
+import ast
+import functools
 import logging
 from typing import Literal
 
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool, tool
+
+from tools._cache import TTLCache
+from tools._concurrency import get_tool_semaphore
 
 logger = logging.getLogger(__name__)
 
+# Weather responses stay fresh for minutes, and agent loops re-request the
+# same (location, units) repeatedly — a hit skips the (future) API round trip.
+_weather_cache = TTLCache(maxsize=256, ttl=300.0)
 
-@tool
-def fetch_weather(
+# Whitelisted callables for calculate_math.
+_ALLOWED_FUNCS = {"abs": abs, "round": round, "min": min, "max": max}
+
+# AST nodes permitted in a math expression — anything else is rejected
+# before compilation, so there is no eval attack surface.
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_math(expression: str):
+    """
+    Parse, validate, and compile a math expression to a code object.
+
+    The lru_cache amortizes parse/compile across repeated identical
+    expressions (common in demos and agent retries).
+
+    Raises:
+        SyntaxError: If the expression is not valid Python.
+        ValueError: If the expression uses anything beyond whitelisted
+            arithmetic nodes, numeric constants, and allowed functions.
+    """
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError("only numeric constants are allowed")
+        if isinstance(node, ast.Name) and node.id not in _ALLOWED_FUNCS:
+            raise ValueError(f"unknown name: {node.id}")
+    return compile(tree, "<math>", "eval")
+
+
+def _resolve_weather(location: str, units: str) -> str:
+    """Resolve one weather lookup against the placeholder (future API) backend."""
+    # Placeholder implementation - replace with actual weather API (the live
+    # call should go through the shared async client in tools/search_tools.py).
+    temp = "22°C" if units == "celsius" else "72°F"
+    return f"Weather in {location}: Sunny, {temp}, humidity 65%, wind 10 km/h"
+
+
+def _fetch_weather(
     location: str,
     units: Literal["celsius", "fahrenheit"] = "celsius"
 ) -> str:
@@ -48,10 +112,51 @@ def fetch_weather(
         Human-readable weather summary including temperature, conditions, humidity, and wind
     """
     logger.info("Tool called: fetch_weather for location='%s', units='%s'", location, units)
-    
-    # Placeholder implementation - replace with actual weather API
-    temp = "22°C" if units == "celsius" else "72°F"
-    return f"Weather in {location}: Sunny, {temp}, humidity 65%, wind 10 km/h"
+
+    key = (location.lower(), units)
+    cached = _weather_cache.get(key)
+    if cached is not None:
+        logger.debug("fetch_weather cache hit for %r", key)
+        return cached
+
+    result = _resolve_weather(location, units)
+    _weather_cache.set(key, result)
+    return result
+
+
+async def _afetch_weather(
+    location: str,
+    units: Literal["celsius", "fahrenheit"] = "celsius"
+) -> str:
+    """
+    Async implementation of `fetch_weather`.
+
+    Runs natively on the event loop so parallel tool batches don't push the
+    lookup through a worker thread; shares the sync path's TTL cache.
+    """
+    logger.info(
+        "Tool called (async): fetch_weather for location='%s', units='%s'",
+        location,
+        units,
+    )
+
+    key = (location.lower(), units)
+    cached = _weather_cache.get(key)
+    if cached is not None:
+        logger.debug("fetch_weather cache hit for %r", key)
+        return cached
+
+    async with get_tool_semaphore():
+        result = _resolve_weather(location, units)
+    _weather_cache.set(key, result)
+    return result
+
+
+fetch_weather = StructuredTool.from_function(
+    func=_fetch_weather,
+    coroutine=_afetch_weather,
+    name="fetch_weather",
+)
 
 
 @tool
@@ -75,7 +180,7 @@ def calculate_math(expression: str) -> str:
       - No support for variables, symbolic math, or algebraic expressions
       - No trigonometric functions (sin, cos, tan) or advanced math
       - Expression must be valid Python syntax
-      - Uses sandboxed evaluation for security (no file/network access)
+      - Uses an AST-validated whitelist evaluator (no file/network access)
       - Maximum expression length: reasonable limit to prevent DoS
     
     Args:
@@ -87,10 +192,10 @@ def calculate_math(expression: str) -> str:
     logger.info("Tool called: calculate_math with expression='%s'", expression)
     
     try:
-        # Safe evaluation using Python's eval with restricted builtins
-        # In production, use a safer math parser like py_expression_eval or sympy
-        allowed_names = {"abs": abs, "round": round, "min": min, "max": max}
-        result = eval(expression, {"__builtins__": {}}, allowed_names)
+        # Validation + compilation are cached per expression; only the
+        # evaluation of the precompiled code object runs per call.
+        code = _compile_math(expression)
+        result = eval(code, {"__builtins__": {}}, _ALLOWED_FUNCS)
         return f"Result: {result}"
     except Exception as e:
         logger.warning("Math calculation failed for '%s': %s", expression, e)
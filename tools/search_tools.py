@@ -6,20 +6,223 @@ Tool naming conventions:
   - Descriptive and specific
   - snake_case for consistency
   - Concise but unambiguous
+
+Both tools are built with `StructuredTool.from_function(func=..., coroutine=...)`
+so agent turns that emit several parallel search calls run them concurrently on
+the event loop instead of serializing in a threadpool.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import logging
 import os
+import weakref
+
+from langchain_core.tools import StructuredTool
 
-from langchain_core.tools import tool
+from tools._cache import TTLCache
+from tools._concurrency import get_tool_semaphore
 
 logger = logging.getLogger(__name__)
 
+# Result caches: agent loops routinely re-issue the same query within a turn
+# or across retries — a hit skips the search I/O entirely. Web results go
+# stale faster than the knowledge base, hence the shorter TTL.
+_web_cache = TTLCache(maxsize=1024, ttl=300.0)
+_doc_cache = TTLCache(maxsize=1024, ttl=600.0)
+
+# ── Shared async HTTP client ──────────────────────────────────────────────────
+
+_async_client = None
+
+
+def _get_async_client():
+    """
+    Lazily create the shared pooled `httpx.AsyncClient` singleton.
+
+    One client per process keeps connections warm across tool calls: every
+    search after the first reuses a kept-alive connection instead of paying
+    TCP + TLS handshake (~100-300 ms) again. HTTP/2 multiplexing is enabled
+    when the optional `h2` package is installed. Used by the async tool paths
+    once the live Naver Search API call lands (Phase 6.4).
+    """
+    global _async_client
+    if _async_client is None:
+        import httpx
+
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        _async_client = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+        atexit.register(_close_async_client)
+    return _async_client
+
+
+def _close_async_client() -> None:
+    """Close the shared client at interpreter exit."""
+    global _async_client
+    if _async_client is not None:
+        try:
+            asyncio.run(_async_client.aclose())
+        except Exception:  # pragma: no cover - best-effort cleanup
+            pass
+        _async_client = None
+
+
+# ── Search request batching ───────────────────────────────────────────────────
+
+
+class SearchBatcher:
+    """
+    Coalesce concurrent tool calls into one batched dispatch.
+
+    When the model emits several parallel search tool calls in a single turn,
+    each caller enqueues its request and awaits a future; a short-lived flusher
+    task drains the queue (up to `max_batch` items or `window` seconds of
+    quiet) and resolves the whole batch through one `dispatch` call. This
+    amortizes per-request overhead — HTTP round trips for web search, one
+    embedding forward pass for document search.
+
+    The flusher terminates when the queue empties, so no background task
+    outlives the event loop that created the batcher.
+
+    Params:
+      dispatch: Async callable taking the list of request tuples and returning
+        one result per request, in order.
+      max_batch: Maximum requests resolved per dispatch.
+      window: Seconds to wait for stragglers before dispatching.
+    """
+
+    def __init__(self, dispatch, *, max_batch: int = 10, window: float = 0.02) -> None:
+        self._dispatch = dispatch
+        self._max_batch = max_batch
+        self._window = window
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    async def search(self, *request) -> str:
+        """Enqueue one request tuple and await its batched result."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((request, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        """Drain the queue in batches until it runs dry, then exit."""
+        while not self._queue.empty():
+            batch: list[tuple[tuple[str, int], asyncio.Future]] = []
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    if not batch:
+                        return
+                    break
+            # Give stragglers from the same tool-call gather a short window
+            # to join the batch before dispatching.
+            if len(batch) < self._max_batch:
+                await asyncio.sleep(self._window)
+                while len(batch) < self._max_batch:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+            requests = [req for req, _ in batch]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("SearchBatcher dispatching %d request(s)", len(requests))
+            try:
+                results = await self._dispatch(requests)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+async def _execute_search_batch(requests: list[tuple[str, int]]) -> list[str]:
+    """
+    Resolve a batch of (query, max_results) search requests in order.
+
+    Today each request resolves against the mock/placeholder backend; Phase
+    6.4 replaces this with a single multi-query POST via _get_async_client()
+    to a provider that accepts {"queries": [...]}.
+    """
+    return [_resolve_web_search(query, max_results) for query, max_results in requests]
+
+
+# One batcher per event loop: respond_with_tools runs each tool batch under
+# its own asyncio.run(), and queues/tasks cannot cross loops. Dispatch
+# functions are looked up late so tests can monkeypatch them.
+_batchers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_doc_batchers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_batcher() -> SearchBatcher:
+    """Return the web SearchBatcher bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = SearchBatcher(lambda requests: _execute_search_batch(requests))
+        _batchers[loop] = batcher
+    return batcher
+
+
+def _get_doc_batcher() -> SearchBatcher:
+    """Return the document SearchBatcher bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    batcher = _doc_batchers.get(loop)
+    if batcher is None:
+        batcher = SearchBatcher(lambda requests: _execute_doc_batch(requests))
+        _doc_batchers[loop] = batcher
+    return batcher
+
+
+async def _execute_doc_batch(requests: list[tuple[str, str]]) -> list[str]:
+    """
+    Resolve a batch of (query, collection) document searches together.
+
+    All queries go through retrieve_many in one worker-thread hop, so the
+    embedding function encodes the whole batch in a single forward pass
+    instead of one small kernel per query.
+    """
+    from knowledge.retriever import retrieve_many
+
+    queries = [query for query, _ in requests]
+    doc_lists = await asyncio.to_thread(retrieve_many, queries, k=5)
+    return [
+        _format_document_results(query, docs)
+        for (query, _), docs in zip(requests, doc_lists)
+    ]
+
+
+# ── search_web ────────────────────────────────────────────────────────────────
 
-@tool
-def search_web(query: str, max_results: int = 5) -> str:
+
+def _resolve_web_search(query: str, max_results: int) -> str:
+    """Resolve one web search against the mock or (future) live backend."""
+    if not os.getenv("NAVER_CLIENT_ID"):
+        return _search_mock_news(query, max_results)
+
+    # Phase 6.4: replace with live Naver Search API call.
+    return f"Search results for '{query}':\n1. Result placeholder 1\n2. Result placeholder 2"
+
+
+def _search_web(query: str, max_results: int = 5) -> str:
     """
     Search the internet for current information, news, and web content.
 
@@ -54,11 +257,37 @@ def search_web(query: str, max_results: int = 5) -> str:
     """
     logger.info("Tool called: search_web with query='%s'", query)
 
-    if not os.getenv("NAVER_CLIENT_ID"):
-        return _search_mock_news(query, max_results)
+    key = (query, max_results)
+    cached = _web_cache.get(key)
+    if cached is not None:
+        logger.debug("search_web cache hit for %r", key)
+        return cached
 
-    # Phase 6.4: replace with live Naver Search API call.
-    return f"Search results for '{query}':\n1. Result placeholder 1\n2. Result placeholder 2"
+    result = _resolve_web_search(query, max_results)
+    _web_cache.set(key, result)
+    return result
+
+
+async def _asearch_web(query: str, max_results: int = 5) -> str:
+    """
+    Async implementation of `search_web`.
+
+    Runs natively on the event loop so N parallel search tool calls cost the
+    max of their I/O latencies, not the sum. Concurrent calls coalesce through
+    the per-loop SearchBatcher into a single batched dispatch.
+    """
+    logger.info("Tool called (async): search_web with query='%s'", query)
+
+    key = (query, max_results)
+    cached = _web_cache.get(key)
+    if cached is not None:
+        logger.debug("search_web cache hit for %r", key)
+        return cached
+
+    async with get_tool_semaphore():
+        result = await _get_batcher().search(query, max_results)
+    _web_cache.set(key, result)
+    return result
 
 
 def _search_mock_news(query: str, max_results: int) -> str:
@@ -79,8 +308,17 @@ def _search_mock_news(query: str, max_results: int) -> str:
     return "\n".join(lines)
 
 
-@tool
-def search_documents(query: str, collection: str = "default") -> str:
+search_web = StructuredTool.from_function(
+    func=_search_web,
+    coroutine=_asearch_web,
+    name="search_web",
+)
+
+
+# ── search_documents ──────────────────────────────────────────────────────────
+
+
+def _search_documents(query: str, collection: str = "default") -> str:
     """
     Search internal document repositories and knowledge bases for relevant information.
 
@@ -117,17 +355,56 @@ def search_documents(query: str, collection: str = "default") -> str:
     """
     logger.info("Tool called: search_documents with query='%s', collection='%s'", query, collection)
 
+    key = (query, collection)
+    cached = _doc_cache.get(key)
+    if cached is not None:
+        logger.debug("search_documents cache hit for %r", key)
+        return cached
+
     try:
         from knowledge.retriever import retrieve
 
         docs = retrieve(query, k=5)
-        if not docs:
-            return f"'{query}'에 대한 문서를 찾지 못했습니다. (knowledge base가 비어 있거나 관련 문서가 없습니다.)"
+        result = _format_document_results(query, docs)
+        _doc_cache.set(key, result)
+        return result
 
-        lines = [f"[지식베이스] '{query}' 검색 결과 ({len(docs)}건):"]
-        for i, doc in enumerate(docs, 1):
-            lines.append(f"\n{i}. [출처: {doc['source']}]\n{doc['content']}")
-        return "\n".join(lines)
+    except ImportError:
+        logger.debug("chromadb not installed — returning placeholder for search_documents")
+        return (
+            f"문서 검색 기능을 사용하려면 chromadb를 설치하세요: pip install chromadb\n"
+            f"(쿼리: '{query}')"
+        )
+    except Exception as exc:
+        logger.warning("search_documents error: %s", exc)
+        return f"문서 검색 중 오류가 발생했습니다: {exc}"
+
+
+async def _asearch_documents(query: str, collection: str = "default") -> str:
+    """
+    Async implementation of `search_documents`.
+
+    Concurrent calls coalesce through the per-loop document batcher, which
+    embeds and queries the whole batch in one worker-thread hop; document and
+    web searches in the same tool batch no longer serialize behind each other.
+    """
+    logger.info(
+        "Tool called (async): search_documents with query='%s', collection='%s'",
+        query,
+        collection,
+    )
+
+    key = (query, collection)
+    cached = _doc_cache.get(key)
+    if cached is not None:
+        logger.debug("search_documents cache hit for %r", key)
+        return cached
+
+    try:
+        async with get_tool_semaphore():
+            result = await _get_doc_batcher().search(query, collection)
+        _doc_cache.set(key, result)
+        return result
 
     except ImportError:
         logger.debug("chromadb not installed — returning placeholder for search_documents")
@@ -138,3 +415,21 @@ def search_documents(query: str, collection: str = "default") -> str:
     except Exception as exc:
         logger.warning("search_documents error: %s", exc)
         return f"문서 검색 중 오류가 발생했습니다: {exc}"
+
+
+def _format_document_results(query: str, docs: list[dict]) -> str:
+    """Format retriever hits as a numbered, source-attributed result string."""
+    if not docs:
+        return f"'{query}'에 대한 문서를 찾지 못했습니다. (knowledge base가 비어 있거나 관련 문서가 없습니다.)"
+
+    lines = [f"[지식베이스] '{query}' 검색 결과 ({len(docs)}건):"]
+    for i, doc in enumerate(docs, 1):
+        lines.append(f"\n{i}. [출처: {doc['source']}]\n{doc['content']}")
+    return "\n".join(lines)
+
+
+search_documents = StructuredTool.from_function(
+    func=_search_documents,
+    coroutine=_asearch_documents,
+    name="search_documents",
+)
@@ -9,6 +9,8 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import re
 import sys
 from pathlib import Path
 
@@ -25,91 +27,111 @@ from tools import (
 )
 from tools.tool_manager import list_available_tools
 
+# verb_noun convention: lowercase snake_case with at least two parts.
+# One compiled-regex scan per name replaces the separate underscore /
+# lowercase / split checks.
+_NAME_RE = re.compile(r"[a-z]+(?:_[a-z0-9]+)+")
+
+
+async def a_test_tool(tool, args: dict, test_name: str) -> str:
+    """
+    Invoke a single tool asynchronously and return its formatted report.
+
+    Returning the text (instead of printing inside the coroutine) keeps
+    concurrent test output from interleaving.
+    """
+    lines = [
+        f"\n{'='*60}",
+        f"Testing: {test_name}",
+        f"Tool: {tool.name}",
+        f"Args: {args}",
+        "-" * 60,
+    ]
 
-def test_tool(tool, args: dict, test_name: str):
-    """Test a single tool with given arguments."""
-    print(f"\n{'='*60}")
-    print(f"Testing: {test_name}")
-    print(f"Tool: {tool.name}")
-    print(f"Args: {args}")
-    print("-" * 60)
-    
     try:
-        result = tool.invoke(args)
-        print(f"[OK] SUCCESS")
-        print(f"Result: {result}")
+        result = await tool.ainvoke(args)
+        lines.append("[OK] SUCCESS")
+        lines.append(f"Result: {result}")
     except Exception as e:
-        print(f"[FAIL] FAILED")
-        print(f"Error: {str(e)}")
-    
-    print("=" * 60)
-
-
-def main():
-    """Run all tool tests."""
-    print("\n" + "=" * 60)
-    print("TOOL NAMING CONVENTION VERIFICATION")
-    print("=" * 60)
-    
+        lines.append("[FAIL] FAILED")
+        lines.append(f"Error: {str(e)}")
+
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def _emit(buf: list[str]) -> None:
+    """Write buffered lines with one stdout call, then clear the buffer."""
+    sys.stdout.write("\n".join(buf))
+    sys.stdout.write("\n")
+    buf.clear()
+
+
+async def amain():
+    """Run all tool tests, executing the invocations concurrently."""
+    # Buffer each section and write it in one call: dozens of prints would
+    # each pay the stdout lock/encode/flush cost.
+    buf: list[str] = []
+
+    buf.append("\n" + "=" * 60)
+    buf.append("TOOL NAMING CONVENTION VERIFICATION")
+    buf.append("=" * 60)
+
     # List all tools
     tools = list_available_tools()
-    print(f"\nTotal tools registered: {len(tools)}")
-    print("\nTool names:")
+    buf.append(f"\nTotal tools registered: {len(tools)}")
+    buf.append("\nTool names:")
     for i, tool_name in enumerate(tools, 1):
         # Verify naming convention
-        has_underscore = "_" in tool_name
-        is_lower = tool_name.islower() or "_" in tool_name
-        parts = tool_name.split("_")
-        is_verb_noun = len(parts) >= 2
-        
-        status = "[OK]" if (has_underscore and is_lower and is_verb_noun) else "[FAIL]"
-        print(f"{i}. {status} {tool_name}")
-    
-    print("\n" + "=" * 60)
-    print("TOOL EXECUTION TESTS")
-    print("=" * 60)
-    
-    # Test each tool
-    test_tool(
-        search_web,
-        {"query": "LangChain tutorials"},
-        "Web search"
-    )
-    
-    test_tool(
-        search_documents,
-        {"query": "API documentation", "collection": "docs"},
-        "Document search"
-    )
-    
-    test_tool(
-        fetch_weather,
-        {"location": "San Francisco", "units": "fahrenheit"},
-        "Weather fetch"
-    )
-    
-    test_tool(
-        calculate_math,
-        {"expression": "2 + 2"},
-        "Math calculation"
-    )
-    
-    test_tool(
-        get_current_time,
-        {"timezone_name": "UTC"},
-        "Get current time"
-    )
-    
-    test_tool(
-        convert_currency,
-        {"amount": 100.0, "from_currency": "USD", "to_currency": "EUR"},
-        "Currency conversion"
+        status = "[OK]" if _NAME_RE.fullmatch(tool_name) else "[FAIL]"
+        buf.append(f"{i}. {status} {tool_name}")
+
+    buf.append("\n" + "=" * 60)
+    buf.append("TOOL EXECUTION TESTS")
+    buf.append("=" * 60)
+    _emit(buf)
+
+    # Run the independent, I/O-bound invocations concurrently: total wall
+    # time is the slowest single call instead of the sum of all six.
+    reports = await asyncio.gather(
+        a_test_tool(
+            search_web,
+            {"query": "LangChain tutorials"},
+            "Web search"
+        ),
+        a_test_tool(
+            search_documents,
+            {"query": "API documentation", "collection": "docs"},
+            "Document search"
+        ),
+        a_test_tool(
+            fetch_weather,
+            {"location": "San Francisco", "units": "fahrenheit"},
+            "Weather fetch"
+        ),
+        a_test_tool(
+            calculate_math,
+            {"expression": "2 + 2"},
+            "Math calculation"
+        ),
+        a_test_tool(
+            get_current_time,
+            {"timezone_name": "UTC"},
+            "Get current time"
+        ),
+        a_test_tool(
+            convert_currency,
+            {"amount": 100.0, "from_currency": "USD", "to_currency": "EUR"},
+            "Currency conversion"
+        ),
     )
-    
-    print("\n" + "=" * 60)
-    print("NAMING CONVENTION SUMMARY")
-    print("=" * 60)
-    
+    buf.extend(reports)
+    _emit(buf)
+
+    buf.append("\n" + "=" * 60)
+    buf.append("NAMING CONVENTION SUMMARY")
+    buf.append("=" * 60)
+
     conventions = [
         ("[OK]", "verb_noun format", "All tools use verb_noun structure"),
         ("[OK]", "snake_case", "All tools use lowercase with underscores"),
@@ -117,14 +139,19 @@ def main():
         ("[OK]", "Concise", "Names are short but unambiguous"),
         ("[OK]", "Consistent", "All follow the same pattern"),
     ]
-    
+
     for status, rule, description in conventions:
-        print(f"{status} {rule:20s} - {description}")
-    
-    print("\n" + "=" * 60)
-    print("All tests completed!")
-    print("=" * 60 + "\n")
+        buf.append(f"{status} {rule:20s} - {description}")
+
+    buf.append("\n" + "=" * 60)
+    buf.append("All tests completed!")
+    buf.append("=" * 60 + "\n")
+    _emit(buf)
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
-    main()
+    from tools._logging import configure_tools_logging
+
+    configure_tools_logging()
+    asyncio.run(amain())
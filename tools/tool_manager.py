@@ -9,34 +9,79 @@ Project role:
 from __future__ import annotations
 
 import logging
-from typing import Any
+import weakref
+from typing import TYPE_CHECKING, Any
 
-from langchain_core.language_models import BaseChatModel
-from langchain_core.tools import BaseTool
-
-from tools import (
-    calculate_math,
-    convert_currency,
-    fetch_weather,
-    get_current_time,
-    search_documents,
-    search_web,
-)
-from tools.news_tools import parse_news_article
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.tools import BaseTool
 
 logger = logging.getLogger(__name__)
 
 
-# Tool registry - easily enable/disable tools by commenting out
-AVAILABLE_TOOLS: list[BaseTool] = [
-    search_web,
-    search_documents,
-    fetch_weather,
-    calculate_math,
-    get_current_time,
-    convert_currency,
-    parse_news_article,
-]
+def _load_available_tools() -> tuple[BaseTool, ...]:
+    """
+    Import every tool module and build the registry tuple.
+
+    Deferred to first use: the tool imports pull in langchain_core and run
+    Pydantic schema construction for each tool, which is cold-start cost the
+    Streamlit app should not pay until tools are actually needed.
+    """
+    # Tool registry - easily enable/disable tools by commenting out.
+    # A tuple: the registry is read-only after load, and iterating it is
+    # marginally cheaper than a list.
+    from tools import (
+        calculate_math,
+        convert_currency,
+        fetch_weather,
+        get_current_time,
+        search_documents,
+        search_web,
+    )
+    from tools.news_tools import parse_news_article
+
+    return (
+        search_web,
+        search_documents,
+        fetch_weather,
+        calculate_math,
+        get_current_time,
+        convert_currency,
+        parse_news_article,
+    )
+
+
+# Registry triple (tools, name→tool dict, name tuple), built on first access.
+# The dict/tuple give O(1) per-tool-call dispatch instead of list rescans.
+_registry: tuple | None = None
+
+
+def _get_registry() -> tuple:
+    """Build (once) and return the (tools, by_name, names) registry triple."""
+    global _registry
+    if _registry is None:
+        tools = _load_available_tools()
+        by_name = {t.name: t for t in tools}
+        _registry = (tools, by_name, tuple(by_name))
+    return _registry
+
+
+def __getattr__(name: str):
+    # PEP 562: expose AVAILABLE_TOOLS lazily so importing this module does not
+    # trigger the tool imports. Cached in globals after the first access, so
+    # every importer sees the same list object.
+    if name == "AVAILABLE_TOOLS":
+        tools = _get_registry()[0]
+        globals()["AVAILABLE_TOOLS"] = tools
+        return tools
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Memoized bind_tools results: binding re-serializes every tool's JSON schema,
+# which dominates warm-request latency when Streamlit reruns rebind per input.
+# Keyed on model identity + tool names + options; a weakref staleness check
+# guards against id() reuse, and a small cap bounds what the cache can pin.
+_BOUND_MODEL_CACHE: dict[tuple, tuple[weakref.ref, BaseChatModel]] = {}
+_BOUND_MODEL_CACHE_MAX = 32
 
 
 def bind_tools_to_model(
@@ -47,7 +92,10 @@ def bind_tools_to_model(
 ) -> BaseChatModel:
     """
     Bind tools to a chat model for tool calling capability.
-    
+
+    Repeat calls with the same model, tool set, and options return the
+    memoized bound model instead of re-serializing every tool schema.
+
     Args:
         model: The base chat model to bind tools to
         tools: List of tools to bind. If None, uses AVAILABLE_TOOLS
@@ -66,21 +114,65 @@ def bind_tools_to_model(
         >>> model_with_tools = bind_tools_to_model(model)
     """
     if tools is None:
-        tools = AVAILABLE_TOOLS
-        
-    logger.info(
-        "Binding %d tools to model: %s",
-        len(tools),
-        [t.name for t in tools]
-    )
-    
+        # Registry names are precomputed — no per-call attribute walk.
+        registry = _get_registry()
+        tools, tool_names = registry[0], registry[2]
+    else:
+        tool_names = tuple(t.name for t in tools)
+
+    key = (id(model), tool_names, tool_choice, parallel_tool_calls)
+    entry = _BOUND_MODEL_CACHE.get(key)
+    if entry is not None and entry[0]() is model:
+        logger.debug("Reusing cached tool binding for %d tools", len(tools))
+        return entry[1]
+
+    logger.info("Binding %d tools to model: %s", len(tools), tool_names)
+
     bind_kwargs: dict[str, Any] = {}
     if tool_choice is not None:
         bind_kwargs["tool_choice"] = tool_choice
     if not parallel_tool_calls:
         bind_kwargs["parallel_tool_calls"] = False
-        
-    return model.bind_tools(tools, **bind_kwargs)
+
+    bound = model.bind_tools(tools, **bind_kwargs)
+
+    try:
+        model_ref = weakref.ref(
+            model, lambda _, k=key: _BOUND_MODEL_CACHE.pop(k, None)
+        )
+    except TypeError:
+        # Model type does not support weak references — skip caching.
+        return bound
+
+    while len(_BOUND_MODEL_CACHE) >= _BOUND_MODEL_CACHE_MAX:
+        _BOUND_MODEL_CACHE.pop(next(iter(_BOUND_MODEL_CACHE)))
+    _BOUND_MODEL_CACHE[key] = (model_ref, bound)
+    return bound
+
+
+# OpenAI-format schemas for the registry tools, converted once per process.
+_schemas: dict[str, dict] | None = None
+
+
+def get_tool_schemas() -> dict[str, dict]:
+    """
+    Return precompiled OpenAI-format JSON schemas for the registry tools.
+
+    Pydantic-to-JSON-Schema conversion is the expensive part of tool binding;
+    this runs it once per process and hands back the same dict afterwards.
+    Repeat binds for a known model already skip conversion entirely via the
+    bind cache — this covers any other consumer of the schemas (debug views,
+    request inspection, custom bind paths).
+
+    Returns:
+        Mapping of tool name to its converted schema dict.
+    """
+    global _schemas
+    if _schemas is None:
+        from langchain_core.utils.function_calling import convert_to_openai_tool
+
+        _schemas = {t.name: convert_to_openai_tool(t) for t in _get_registry()[0]}
+    return _schemas
 
 
 def get_tool_by_name(name: str) -> BaseTool | None:
@@ -93,10 +185,7 @@ def get_tool_by_name(name: str) -> BaseTool | None:
     Returns:
         The tool if found, None otherwise
     """
-    for tool in AVAILABLE_TOOLS:
-        if tool.name == name:
-            return tool
-    return None
+    return _get_registry()[1].get(name)
 
 
 def list_available_tools() -> list[str]:
@@ -106,4 +195,4 @@ def list_available_tools() -> list[str]:
     Returns:
         List of tool names
     """
-    return [tool.name for tool in AVAILABLE_TOOLS]
+    return list(_get_registry()[2])
@@ -11,12 +11,34 @@ Tool naming conventions:
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+import time
 
 from langchain_core.tools import tool
 
 logger = logging.getLogger(__name__)
 
+# Placeholder exchange rates, expressed as units of USD per one unit of
+# currency — replace with actual currency API. The dense pairwise table is
+# derived once at import via triangulation through USD, so every direction
+# (including EUR→GBP) is a single dict lookup with no missing-pair asymmetry.
+_USD_PER_UNIT = {
+    "USD": 1.0,
+    "EUR": 1.09,
+    "GBP": 1.27,
+}
+_RATES: dict[tuple[str, str], float] = {
+    (a, b): _USD_PER_UNIT[a] / _USD_PER_UNIT[b]
+    for a in _USD_PER_UNIT
+    for b in _USD_PER_UNIT
+}
+
+# Result templates as module constants: the per-call work is one .format()
+# on the path actually taken, rather than building f-strings for both.
+_CONVERT_OK_TMPL = "{amount:.2f} {fc} = {converted:.2f} {tc}"
+_CONVERT_NA_TMPL = (
+    "Exchange rate not available for {fc} to {tc} (placeholder implementation)"
+)
+
 
 @tool
 def get_current_time(timezone_name: str = "UTC") -> str:
@@ -41,15 +63,17 @@ def get_current_time(timezone_name: str = "UTC") -> str:
         Formatted timestamp string in YYYY-MM-DD HH:MM:SS format with timezone
     """
     logger.info("Tool called: get_current_time for timezone='%s'", timezone_name)
-    
-    try:
-        # For simplicity, using UTC. In production, use pytz or zoneinfo for proper timezone handling
-        current_time = datetime.now(timezone.utc)
-        formatted_time = current_time.strftime("%Y-%m-%d %H:%M:%S %Z")
-        return f"Current time in {timezone_name}: {formatted_time}"
-    except Exception as e:
-        logger.warning("Failed to get time for timezone '%s': %s", timezone_name, e)
-        return f"Error getting time for timezone '{timezone_name}': {str(e)}"
+
+    # For simplicity, using UTC. In production, use pytz or zoneinfo for proper
+    # timezone handling (and move error handling to that conversion path).
+    # time.gmtime + f-string formatting skips the per-call datetime allocation
+    # and strftime format-string walk, and cannot raise for valid clock input.
+    tm = time.gmtime()
+    formatted_time = (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d} "
+        f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d} UTC"
+    )
+    return f"Current time in {timezone_name}: {formatted_time}"
 
 
 @tool
@@ -87,18 +111,8 @@ def convert_currency(
         amount, from_currency, to_currency
     )
     
-    # Placeholder exchange rates - replace with actual currency API
-    exchange_rates = {
-        ("USD", "EUR"): 0.92,
-        ("USD", "GBP"): 0.79,
-        ("EUR", "USD"): 1.09,
-        ("GBP", "USD"): 1.27,
-    }
-    
-    rate_key = (from_currency.upper(), to_currency.upper())
-    
-    if rate_key in exchange_rates:
-        converted = amount * exchange_rates[rate_key]
-        return f"{amount:.2f} {from_currency} = {converted:.2f} {to_currency}"
-    else:
-        return f"Exchange rate not available for {from_currency} to {to_currency} (placeholder implementation)"
+    fc, tc = from_currency.upper(), to_currency.upper()
+    rate = _RATES.get((fc, tc))
+    if rate is None:
+        return _CONVERT_NA_TMPL.format(fc=fc, tc=tc)
+    return _CONVERT_OK_TMPL.format(amount=amount, fc=fc, converted=amount * rate, tc=tc)